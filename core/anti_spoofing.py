@@ -12,12 +12,37 @@ import os
 import cv2
 import numpy as np
 import time
-from typing import Tuple, List, Dict, Any, Optional
+from threading import BoundedSemaphore, RLock
+from typing import Tuple, List, Dict, Any, NamedTuple, Optional
 from ultralytics import YOLO
 
 from utils.logger import logger
 from utils.config import Config
 
+class SpoofingMetrics(NamedTuple):
+    """
+    Metadata of one anti-spoofing check.
+    
+    Scored faces carry the three metrics and the face box; results that
+    could not be scored only carry a message or an error.
+    """
+    moire_score: Optional[float] = None
+    lighting_consistency: Optional[float] = None
+    texture_score: Optional[float] = None
+    face_box: Optional[List[int]] = None
+    message: Optional[str] = None
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the fields that are set, e.g. for logging.
+        
+        Returns:
+            Dict[str, Any]: Field name to value, without unset fields
+        """
+        return {key: value for key, value in self._asdict().items() if value is not None}
+
+
 class AntiSpoofingSystem:
     """
     Anti-spoofing system using YOLO for detecting presentation attacks.
@@ -26,6 +51,9 @@ class AntiSpoofingSystem:
     attempts in face recognition systems.
     """
     
+    # (width, height) face crops are resized to before batched inference
+    FACE_INPUT_SIZE = (224, 224)
+    
     def __init__(self, models_dir: str = "data/anti_spoofing_models"):
         """
         Initialize the anti-spoofing system.
@@ -48,9 +76,10 @@ class AntiSpoofingSystem:
         # Download models if not exists
         self._check_and_download_models()
         
-        # Load models
-        self.yolo_model = None
-        self.spoofing_model = None
+        # Load models. (yolo_model, spoofing_model) is swapped as one unit
+        # under _models_lock so a reload never mixes old and new handles.
+        self._models_lock = RLock()
+        self._models = (None, None)
         self._load_models()
         
         # Get settings from config
@@ -63,6 +92,10 @@ class AntiSpoofingSystem:
         self.real_count = 0
         self.spoofing_count = 0
         
+        # Bounds concurrent model calls (live test, image test, recognition)
+        # so the inference backends' thread pools are not oversubscribed
+        self._infer_sem = BoundedSemaphore(max(1, (os.cpu_count() or 2) // 2))
+        
         logger.info("Anti-spoofing system initialized")
     
     def _check_and_download_models(self) -> None:
@@ -91,22 +124,42 @@ class AntiSpoofingSystem:
             except Exception as e:
                 logger.error(f"Error downloading anti-spoofing model: {e}")
     
+    @property
+    def yolo_model(self) -> Optional[Any]:
+        """YOLOv8 face detection model, or None if not loaded."""
+        return self._models[0]
+    
+    @property
+    def spoofing_model(self) -> Optional[Any]:
+        """Anti-spoofing model, or None if not loaded."""
+        return self._models[1]
+    
     def _load_models(self) -> None:
-        """Load the YOLO and anti-spoofing models."""
+        """
+        Load the YOLO and anti-spoofing models.
+        
+        Both models are loaded before either is published, so callers
+        running inference keep using the previous pair until the swap.
+        If loading fails the previous pair stays in place.
+        """
         try:
             # Load YOLOv8 face detection model
-            self.yolo_model = YOLO(self.yolo_model_path)
+            yolo_model = YOLO(self.yolo_model_path)
             logger.info("YOLOv8 face detection model loaded successfully")
             
             # Load anti-spoofing model
-            self.spoofing_model = YOLO(self.spoofing_model_path)
+            spoofing_model = YOLO(self.spoofing_model_path)
             logger.info("Anti-spoofing model loaded successfully")
         except Exception as e:
             logger.error(f"Error loading models: {e}")
             if "No module named 'ultralytics'" in str(e):
                 logger.error("Please install ultralytics: pip install ultralytics")
+            return
+        
+        with self._models_lock:
+            self._models = (yolo_model, spoofing_model)
     
-    def is_real_face(self, frame: np.ndarray) -> Tuple[bool, float, Optional[Dict[str, Any]]]:
+    def is_real_face(self, frame: np.ndarray) -> Tuple[bool, float, Optional[SpoofingMetrics]]:
         """
         Determine if a face is real or a spoofing attempt.
         
@@ -114,16 +167,40 @@ class AntiSpoofingSystem:
             frame (np.ndarray): Input image frame
             
         Returns:
-            Tuple[bool, float, Optional[Dict[str, Any]]]: (is_real, confidence, metadata)
+            Tuple[bool, float, Optional[SpoofingMetrics]]: (is_real, confidence, metadata)
+        """
+        return self.is_real_face_batch([frame])[0]
+    
+    def is_real_face_batch(self, face_imgs: List[np.ndarray]) -> List[Tuple[bool, float, Optional[SpoofingMetrics]]]:
         """
+        Determine for several face images at once whether each is real.
+        
+        The YOLO face detector is called once for the whole list, so its
+        per-call overhead is paid once per frame rather than once per face;
+        each face region found is then scored by _score_face.
+        
+        Args:
+            face_imgs (List[np.ndarray]): Face images, e.g. all crops from one frame,
+                or an (N, H, W, 3) array of equally sized crops
+            
+        Returns:
+            List[Tuple[bool, float, Optional[SpoofingMetrics]]]: (is_real, confidence, metadata) per image
+        """
+        if len(face_imgs) == 0:
+            return []
+        
         if not self.enable_anti_spoofing:
             # If anti-spoofing is disabled, always return True
-            return True, 1.0, None
+            return [(True, 1.0, None)] * len(face_imgs)
+        
+        # Take strong references once; inference runs outside the lock
+        with self._models_lock:
+            yolo_model, spoofing_model = self._models
         
-        if self.yolo_model is None or self.spoofing_model is None:
+        if yolo_model is None or spoofing_model is None:
             # If models aren't loaded, assume real face but log warning
             logger.warning("Anti-spoofing models not loaded, assuming real face")
-            return True, 0.5, None
+            return [(True, 0.5, None)] * len(face_imgs)
         
         # Update metrics
         current_time = time.time()
@@ -133,99 +210,132 @@ class AntiSpoofingSystem:
             self.spoofing_count = 0
             self.last_detection_time = current_time
         
-        self.detection_count += 1
+        self.detection_count += len(face_imgs)
         
         try:
-            # Detect faces using YOLOv8
-            yolo_results = self.yolo_model(frame, verbose=False)
-            
-            # If no face detected, return indeterminate result
-            if len(yolo_results[0].boxes) == 0:
-                return True, 0.5, {"message": "No face detected"}
-            
-            # Get the face with highest confidence
-            boxes = yolo_results[0].boxes
-            conf = boxes.conf.cpu().numpy()
-            if len(conf) == 0:
-                return True, 0.5, {"message": "No face detected with sufficient confidence"}
-            
-            # Get the box with highest confidence
-            best_idx = np.argmax(conf)
-            box = boxes[best_idx].xyxy.cpu().numpy()[0]
-            
-            # Extract face region with margin
-            x1, y1, x2, y2 = map(int, box)
-            # Add margin (10% on each side)
-            height, width = frame.shape[:2]
-            margin_x = int((x2 - x1) * 0.1)
-            margin_y = int((y2 - y1) * 0.1)
-            x1 = max(0, x1 - margin_x)
-            y1 = max(0, y1 - margin_y)
-            x2 = min(width, x2 + margin_x)
-            y2 = min(height, y2 + margin_y)
-            
-            face_img = frame[y1:y2, x1:x2]
-            
-            # Run anti-spoofing model on the face region
-            spoofing_results = self.spoofing_model(face_img, verbose=False)
-            
-            # Process results - depends on the model's output format
-            # For a classification model, we would extract the class probabilities
-            # This is a placeholder and would be replaced with actual implementation
-            
-            # For this example, we'll implement a simplified version:
-            # Extract "real" vs "spoof" scores
-            
-            # Analyze face texture and lighting for signs of spoofing
-            # These are common techniques in anti-spoofing:
-            
-            # 1. Check for moiré patterns (common in printed photos and screens)
-            gray = cv2.cvtColor(face_img, cv2.COLOR_BGR2GRAY)
-            blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-            edges = cv2.Laplacian(blurred, cv2.CV_64F)
-            moire_score = np.std(edges) / 10  # Normalize
-            
-            # 2. Check for lighting consistency
-            hsv = cv2.cvtColor(face_img, cv2.COLOR_BGR2HSV)
-            saturation = hsv[:,:,1]
-            value = hsv[:,:,2]
-            light_consistency = np.std(value) / 40  # Higher std means inconsistent lighting
-            
-            # 3. Check for texture naturalness
-            texture_gradient = cv2.Sobel(gray, cv2.CV_64F, 1, 1, ksize=5)
-            texture_score = np.mean(np.abs(texture_gradient)) / 10
-            
-            # Combine scores (this would be replaced by the actual model output)
-            # For a real model, these calculations would be internal to the model
-            real_score = 0.5 + (texture_score * 0.3) - (moire_score * 0.4) - (light_consistency * 0.3)
-            real_score = max(0.0, min(1.0, real_score))  # Clamp to [0, 1]
-            
-            # Add random variation for demonstration (would be removed in production)
-            real_score = min(1.0, max(0.0, real_score + np.random.normal(0, 0.05)))
-            
-            # Determine result based on threshold
-            is_real = real_score > self.spoofing_detection_threshold
-            
-            # Update counters
-            if is_real:
-                self.real_count += 1
-            else:
-                self.spoofing_count += 1
-            
-            # Prepare metadata
-            metadata = {
-                "moire_score": float(moire_score),
-                "lighting_consistency": float(light_consistency),
-                "texture_score": float(texture_score),
-                "face_box": [int(x1), int(y1), int(x2), int(y2)]
-            }
-            
-            return is_real, real_score, metadata
+            # Detect faces using YOLOv8, one batched call for all images
+            with self._infer_sem:
+                yolo_results = yolo_model(list(face_imgs), verbose=False)
+            
+            results: List[Optional[Tuple[bool, float, Optional[SpoofingMetrics]]]] = []
+            crops = []
+            for frame, yolo_result in zip(face_imgs, yolo_results):
+                box = self._best_face_box(frame, yolo_result)
+                if box is None:
+                    # If no face detected, return indeterminate result
+                    results.append((True, 0.5, SpoofingMetrics(message="No face detected")))
+                    continue
+                x1, y1, x2, y2 = box
+                crops.append((len(results), frame[y1:y2, x1:x2], box))
+                results.append(None)
+            
+            for index, face_img, box in crops:
+                results[index] = self._score_face(face_img, box)
+            
+            return results
             
         except Exception as e:
             logger.error(f"Error in anti-spoofing detection: {e}")
             # Return conservative result on error
-            return True, 0.5, {"error": str(e)}
+            return [(True, 0.5, SpoofingMetrics(error=str(e)))] * len(face_imgs)
+    
+    def _best_face_box(self, frame: np.ndarray, yolo_result: Any) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Get the most confident YOLO face box, widened by a 10% margin.
+        
+        Args:
+            frame (np.ndarray): Image the detection was run on
+            yolo_result: YOLO result for that image
+            
+        Returns:
+            Optional[Tuple[int, int, int, int]]: (x1, y1, x2, y2) or None if no face was found
+        """
+        boxes = yolo_result.boxes
+        if len(boxes) == 0:
+            return None
+        
+        # Get the box with highest confidence
+        conf = boxes.conf.cpu().numpy()
+        if len(conf) == 0:
+            return None
+        best_idx = np.argmax(conf)
+        box = boxes[best_idx].xyxy.cpu().numpy()[0]
+        
+        # Extract face region with margin
+        x1, y1, x2, y2 = map(int, box)
+        # Add margin (10% on each side)
+        height, width = frame.shape[:2]
+        margin_x = int((x2 - x1) * 0.1)
+        margin_y = int((y2 - y1) * 0.1)
+        x1 = max(0, x1 - margin_x)
+        y1 = max(0, y1 - margin_y)
+        x2 = min(width, x2 + margin_x)
+        y2 = min(height, y2 + margin_y)
+        return x1, y1, x2, y2
+    
+    def _score_face(self, face_img: np.ndarray, box: Tuple[int, int, int, int]) -> Tuple[bool, float, SpoofingMetrics]:
+        """
+        Score a face region and update the real/spoofing counters.
+        
+        Args:
+            face_img (np.ndarray): Face region
+            box (Tuple[int, int, int, int]): Face region in the source image
+            
+        Returns:
+            Tuple[bool, float, SpoofingMetrics]: (is_real, confidence, metadata)
+        """
+        # Process results - depends on the model's output format
+        # For a classification model, we would extract the class probabilities
+        # This is a placeholder and would be replaced with actual implementation
+        
+        # For this example, we'll implement a simplified version:
+        # Extract "real" vs "spoof" scores
+        
+        # Analyze face texture and lighting for signs of spoofing
+        # These are common techniques in anti-spoofing:
+        
+        # 1. Check for moiré patterns (common in printed photos and screens)
+        gray = cv2.cvtColor(face_img, cv2.COLOR_BGR2GRAY)
+        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+        edges = cv2.Laplacian(blurred, cv2.CV_64F)
+        moire_score = np.std(edges) / 10  # Normalize
+        
+        # 2. Check for lighting consistency
+        hsv = cv2.cvtColor(face_img, cv2.COLOR_BGR2HSV)
+        value = hsv[:,:,2]
+        light_consistency = np.std(value) / 40  # Higher std means inconsistent lighting
+        
+        # 3. Check for texture naturalness
+        texture_gradient = cv2.Sobel(gray, cv2.CV_64F, 1, 1, ksize=5)
+        texture_score = np.mean(np.abs(texture_gradient)) / 10
+        
+        # Combine scores (this would be replaced by the actual model output)
+        # For a real model, these calculations would be internal to the model
+        real_score = 0.5 + (texture_score * 0.3) - (moire_score * 0.4) - (light_consistency * 0.3)
+        real_score = max(0.0, min(1.0, real_score))  # Clamp to [0, 1]
+        
+        # Add random variation for demonstration (would be removed in production)
+        real_score = min(1.0, max(0.0, real_score + np.random.normal(0, 0.05)))
+        
+        # Determine result based on threshold
+        is_real = real_score > self.spoofing_detection_threshold
+        
+        # Update counters
+        if is_real:
+            self.real_count += 1
+        else:
+            self.spoofing_count += 1
+        
+        # Prepare metadata
+        x1, y1, x2, y2 = box
+        metadata = SpoofingMetrics(
+            moire_score=float(moire_score),
+            lighting_consistency=float(light_consistency),
+            texture_score=float(texture_score),
+            face_box=[int(x1), int(y1), int(x2), int(y2)]
+        )
+        
+        return is_real, real_score, metadata
     
     def analyze_face_liveness(self, frames: List[np.ndarray]) -> Tuple[bool, float, Dict[str, Any]]:
         """
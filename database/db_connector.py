@@ -4,12 +4,50 @@ MySQL database connector for the face recognition system.
 
 import mysql.connector
 from mysql.connector import Error
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 import json
 import pickle
+from collections import OrderedDict
 from utils.logger import logger
 
+# The C extension (_mysql_connector) is much faster than the pure Python
+# protocol implementation for short queries. It ships with the official
+# mysql-connector-python wheels; source builds need the MySQL C client.
+_HAVE_CEXT = getattr(mysql.connector, "HAVE_CEXT", False)
+
+# Use orjson for (de)serializing JSON columns when available, it is
+# considerably faster than the standard library encoder.
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 class DatabaseConnector:
+    # Attendance history queries keyed by (has_start_date, has_end_date), so
+    # the server only ever sees these four statement texts.
+    _SQL_HIST = {
+        (False, False): "SELECT date, record FROM attendance WHERE student_name = %s ORDER BY date",
+        (True, False): "SELECT date, record FROM attendance WHERE student_name = %s AND date >= %s ORDER BY date",
+        (False, True): "SELECT date, record FROM attendance WHERE student_name = %s AND date <= %s ORDER BY date",
+        (True, True): "SELECT date, record FROM attendance WHERE student_name = %s AND date >= %s AND date <= %s ORDER BY date",
+    }
+
+    # Filtered asset query; empty filters are passed as '%' so the server
+    # always sees the same statement text.
+    _SQL_ASSETS_LIKE = (
+        "SELECT asset_name, borrower, class, borrowed_at, returned_at FROM assets "
+        "WHERE asset_name LIKE %s AND COALESCE(borrower, '') LIKE %s "
+        "AND COALESCE(class, '') LIKE %s ORDER BY asset_name LIMIT %s"
+    )
+
+    # Number of unregistered card IDs remembered by get_rfid_card()
+    UNKNOWN_CARD_CACHE_SIZE = 256
+
     def __init__(self, host: str, user: str, password: str, database: str, port: int = 3306):
         self.connection_params = {
             'host': host,
@@ -19,17 +57,40 @@ class DatabaseConnector:
             'port': port
         }
         self.connection = None
+        self._max_packet = 4 * 1024 * 1024  # MySQL default, refreshed on connect
+        self._unknown_cards: "OrderedDict[str, None]" = OrderedDict()
         self._connect()
         self._create_tables()
     
     def _connect(self) -> None:
         try:
-            self.connection = mysql.connector.connect(**self.connection_params)
+            if not _HAVE_CEXT:
+                logger.warning("mysql-connector C extension not available, using pure Python implementation")
+            # Single statements commit on their own; batched writers open an
+            # explicit transaction.
+            self.connection = mysql.connector.connect(
+                use_pure=not _HAVE_CEXT, autocommit=True, **self.connection_params
+            )
             logger.info("Successfully connected to MySQL database")
+            self._read_max_packet()
         except Error as e:
             logger.error(f"Error connecting to MySQL database: {e}")
             raise
 
+    def _read_max_packet(self) -> None:
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT @@max_allowed_packet")
+            row = cursor.fetchone()
+            if row and row[0]:
+                self._max_packet = int(row[0])
+        except Error as e:
+            logger.warning(f"Could not read max_allowed_packet, using {self._max_packet}: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
     def _ensure_connection(self) -> None:
         try:
             if self.connection is None or not self.connection.is_connected():
@@ -38,6 +99,12 @@ class DatabaseConnector:
             logger.error(f"Error reconnecting to database: {e}")
             raise
 
+    def _rollback(self) -> None:
+        try:
+            self.connection.rollback()
+        except Error as e:
+            logger.error(f"Error rolling back transaction: {e}")
+
     def _create_tables(self) -> None:
         if not self.connection:
             raise Error("No database connection")
@@ -81,6 +148,7 @@ class DatabaseConnector:
                     date DATE,
                     student_name VARCHAR(255),
                     record JSON,
+                    UNIQUE KEY uq_attendance_day (date, student_name),
                     FOREIGN KEY (student_name) REFERENCES students(name)
                 )
             """)
@@ -97,6 +165,10 @@ class DatabaseConnector:
                 )
             """)
             
+            # Secondary indexes for the per-student lookups
+            self._ensure_index(cursor, "attendance", "idx_att_student_date", ("student_name", "date"))
+            self._ensure_index(cursor, "rfid_cards", "idx_rfid_person", ("student_name",))
+            
             self.connection.commit()
             logger.info("Database tables created successfully")
         except Error as e:
@@ -106,19 +178,45 @@ class DatabaseConnector:
             if cursor:
                 cursor.close()
 
+    def _ensure_index(self, cursor, table: str, index_name: str, columns: Tuple[str, ...]) -> None:
+        """
+        Create an index unless one covering the same leading columns exists.
+
+        MySQL < 8 has no CREATE INDEX IF NOT EXISTS, so the existing indexes
+        are inspected with SHOW INDEX instead.
+        
+        Args:
+            cursor: Open cursor on the connection
+            table (str): Table name
+            index_name (str): Name of the index to create
+            columns (Tuple[str, ...]): Indexed columns, in order
+        """
+        cursor.execute(f"SHOW INDEX FROM {table}")
+        existing: Dict[str, List[str]] = {}
+        for row in cursor.fetchall():
+            # Key_name is column 2 and Column_name column 4, ordered by Seq_in_index
+            existing.setdefault(row[2], []).append(row[4])
+        
+        for key_name, key_columns in existing.items():
+            if key_name == index_name or tuple(key_columns[:len(columns)]) == columns:
+                return
+        
+        cursor.execute(f"CREATE INDEX {index_name} ON {table} ({', '.join(columns)})")
+        logger.info(f"Created index {index_name} on {table}")
+
     def save_student(self, name: str, data: Dict[str, Any]) -> bool:
         if not self.connection:
             return False
         
         cursor = None
         try:
+            payload = _dumps(data)
             cursor = self.connection.cursor()
             cursor.execute(
                 "INSERT INTO students (name, data) VALUES (%s, %s) "
-                "ON DUPLICATE KEY UPDATE data = %s",
-                (name, json.dumps(data), json.dumps(data))
+                "ON DUPLICATE KEY UPDATE data = VALUES(data)",
+                (name, payload)
             )
-            self.connection.commit()
             return True
         except Error as e:
             logger.error(f"Error saving student {name}: {e}")
@@ -133,11 +231,11 @@ class DatabaseConnector:
         
         cursor = None
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            cursor = self.connection.cursor(dictionary=True, buffered=True)
             cursor.execute("SELECT data FROM students WHERE name = %s", (name,))
             result = cursor.fetchone()
             if result and isinstance(result, dict) and 'data' in result:
-                return json.loads(str(result['data']))
+                return _loads(result['data'])
             return None
         except Error as e:
             logger.error(f"Error getting student {name}: {e}")
@@ -146,19 +244,59 @@ class DatabaseConnector:
             if cursor:
                 cursor.close()
 
+    def list_student_names(self) -> List[str]:
+        if not self.connection:
+            return []
+        
+        cursor = None
+        try:
+            # name is UNIQUE, so ORDER BY walks the index without a filesort
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT name FROM students ORDER BY name")
+            return [str(row[0]) for row in cursor.fetchall()]
+        except Error as e:
+            logger.error(f"Error listing student names: {e}")
+            return []
+        finally:
+            if cursor:
+                cursor.close()
+
+    def get_student_field(self, name: str, field: str) -> Optional[str]:
+        if not self.connection:
+            return None
+        
+        cursor = None
+        try:
+            # Let MySQL extract the single value instead of shipping the whole blob
+            cursor = self.connection.cursor(dictionary=True, buffered=True)
+            cursor.execute(
+                "SELECT JSON_UNQUOTE(JSON_EXTRACT(data, %s)) AS v FROM students WHERE name = %s",
+                (f'$."{field}"', name)
+            )
+            result = cursor.fetchone()
+            if result and isinstance(result, dict) and result.get('v') is not None:
+                return str(result['v'])
+            return None
+        except Error as e:
+            logger.error(f"Error getting {field} for student {name}: {e}")
+            return None
+        finally:
+            if cursor:
+                cursor.close()
+
     def save_rfid_card(self, card_id: str, student_name: str) -> bool:
         if not self.connection:
             return False
         
         cursor = None
         try:
+            self._unknown_cards.pop(card_id, None)
             cursor = self.connection.cursor()
             cursor.execute(
                 "INSERT INTO rfid_cards (card_id, student_name) VALUES (%s, %s) "
-                "ON DUPLICATE KEY UPDATE student_name = %s",
-                (card_id, student_name, student_name)
+                "ON DUPLICATE KEY UPDATE student_name = VALUES(student_name)",
+                (card_id, student_name)
             )
-            self.connection.commit()
             return True
         except Error as e:
             logger.error(f"Error saving RFID card {card_id}: {e}")
@@ -171,13 +309,21 @@ class DatabaseConnector:
         if not self.connection:
             return None
         
+        # Unregistered cards are often waved repeatedly; answer from memory
+        if card_id in self._unknown_cards:
+            self._unknown_cards.move_to_end(card_id)
+            return None
+        
         cursor = None
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            cursor = self.connection.cursor(dictionary=True, buffered=True)
             cursor.execute("SELECT student_name FROM rfid_cards WHERE card_id = %s", (card_id,))
             result = cursor.fetchone()
             if result and isinstance(result, dict) and 'student_name' in result:
                 return str(result['student_name'])
+            self._unknown_cards[card_id] = None
+            if len(self._unknown_cards) > self.UNKNOWN_CARD_CACHE_SIZE:
+                self._unknown_cards.popitem(last=False)
             return None
         except Error as e:
             logger.error(f"Error getting RFID card {card_id}: {e}")
@@ -193,15 +339,16 @@ class DatabaseConnector:
         cursor = None
         try:
             cursor = self.connection.cursor()
-            for encoding, name in zip(encodings, names):
-                cursor.execute(
-                    "INSERT INTO face_encodings (student_name, encoding) VALUES (%s, %s)",
-                    (name, pickle.dumps(encoding))
-                )
+            self.connection.start_transaction()
+            cursor.executemany(
+                "INSERT INTO face_encodings (student_name, encoding) VALUES (%s, %s)",
+                [(name, pickle.dumps(encoding)) for encoding, name in zip(encodings, names)]
+            )
             self.connection.commit()
             return True
         except Error as e:
             logger.error(f"Error saving face encodings: {e}")
+            self._rollback()
             return False
         finally:
             if cursor:
@@ -215,14 +362,14 @@ class DatabaseConnector:
         try:
             cursor = self.connection.cursor(dictionary=True)
             cursor.execute("SELECT student_name, encoding FROM face_encodings")
-            results = cursor.fetchall()
+            results = [
+                result for result in cursor.fetchall()
+                if isinstance(result, dict) and 'encoding' in result and 'student_name' in result
+            ]
             
-            encodings = []
-            names = []
-            for result in results:
-                if isinstance(result, dict) and 'encoding' in result and 'student_name' in result:
-                    encodings.append(pickle.loads(result['encoding']))
-                    names.append(str(result['student_name']))
+            # Build both lists with comprehensions so each is allocated once
+            encodings = [pickle.loads(result['encoding']) for result in results]
+            names = [str(result['student_name']) for result in results]
             
             return encodings, names
         except Error as e:
@@ -238,13 +385,13 @@ class DatabaseConnector:
         
         cursor = None
         try:
+            payload = _dumps(record)
             cursor = self.connection.cursor()
             cursor.execute(
                 "INSERT INTO attendance (date, student_name, record) VALUES (%s, %s, %s) "
-                "ON DUPLICATE KEY UPDATE record = %s",
-                (date, student_name, json.dumps(record), json.dumps(record))
+                "ON DUPLICATE KEY UPDATE record = VALUES(record)",
+                (date, student_name, payload)
             )
-            self.connection.commit()
             return True
         except Error as e:
             logger.error(f"Error saving attendance for {student_name} on {date}: {e}")
@@ -253,25 +400,295 @@ class DatabaseConnector:
             if cursor:
                 cursor.close()
 
+    def save_attendance_many(self, records: Iterable[Tuple[str, str, Dict[str, Any]]]) -> bool:
+        """
+        Save many attendance records in a single transaction.
+        
+        Args:
+            records (Iterable[Tuple[str, str, Dict[str, Any]]]): (date, student_name, record) tuples
+            
+        Returns:
+            bool: True if all records were saved, False otherwise
+        """
+        if not self.connection:
+            return False
+        
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            self.connection.start_transaction()
+            cursor.executemany(
+                "INSERT INTO attendance (date, student_name, record) VALUES (%s, %s, %s) "
+                "ON DUPLICATE KEY UPDATE record = VALUES(record)",
+                [(date, student_name, _dumps(record)) for date, student_name, record in records]
+            )
+            self.connection.commit()
+            return True
+        except Error as e:
+            logger.error(f"Error saving attendance batch: {e}")
+            self._rollback()
+            return False
+        finally:
+            if cursor:
+                cursor.close()
+
+    def _iter_rows(self, query: str, params: Tuple[Any, ...], key: str, context: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream (key, record) pairs from an unbuffered cursor.
+        
+        Rows are decoded one at a time instead of materializing the whole
+        result set in the driver and then again as a dict.
+        
+        Args:
+            query (str): SELECT returning the key column and a JSON record column
+            params (Tuple[Any, ...]): Query parameters
+            key (str): Name of the key column
+            context (str): Description used in error messages
+            
+        Yields:
+            Tuple[str, Dict[str, Any]]: Key and decoded record
+        """
+        if not self.connection:
+            return
+        
+        cursor = None
+        try:
+            cursor = self.connection.cursor(dictionary=True, buffered=False)
+            cursor.execute(query, params)
+            for result in cursor:
+                if isinstance(result, dict) and 'record' in result and key in result:
+                    yield str(result[key]), _loads(result['record'])
+        except Error as e:
+            logger.error(f"Error getting {context}: {e}")
+        finally:
+            if cursor:
+                try:
+                    # An unbuffered result must be drained before the
+                    # connection can run another statement.
+                    for _ in cursor:
+                        pass
+                    cursor.close()
+                except Error as e:
+                    logger.error(f"Error closing cursor for {context}: {e}")
+
+    def iter_attendance(self, date: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        return self._iter_rows(
+            "SELECT student_name, record FROM attendance WHERE date = %s",
+            (date,), 'student_name', f"attendance for {date}"
+        )
+
     def get_attendance(self, date: str) -> Dict[str, Dict[str, Any]]:
+        return dict(self.iter_attendance(date))
+
+    def iter_student_attendance_history(self, student_name: str, start_date: Optional[str] = None,
+                                        end_date: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        has_start = start_date is not None
+        has_end = end_date is not None
+        query = self._SQL_HIST[(has_start, has_end)]
+        params = (student_name,) + ((start_date,) if has_start else ()) + ((end_date,) if has_end else ())
+        
+        return self._iter_rows(query, params, 'date', f"attendance history for {student_name}")
+
+    def get_student_attendance_history(self, student_name: str, start_date: Optional[str] = None,
+                                       end_date: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        return dict(self.iter_student_attendance_history(student_name, start_date, end_date))
+
+    @staticmethod
+    def _like_pattern(text: Optional[str]) -> str:
+        """Build a LIKE substring pattern, escaping the LIKE wildcards in ``text``."""
+        if not text:
+            return "%"
+        escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"%{escaped}%"
+
+    def get_assets(self, asset_like: Optional[str] = None, borrower_like: Optional[str] = None,
+                   class_like: Optional[str] = None, limit: int = 500) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch asset records matching substring filters in a single query.
+        
+        Args:
+            asset_like (Optional[str]): Substring of the asset name
+            borrower_like (Optional[str]): Substring of the borrower name
+            class_like (Optional[str]): Substring of the class
+            limit (int): Maximum number of rows returned
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: asset_name -> record, ordered by asset name
+        """
         if not self.connection:
             return {}
         
+        params = (self._like_pattern(asset_like), self._like_pattern(borrower_like),
+                  self._like_pattern(class_like), int(limit))
+        assets: Dict[str, Dict[str, Any]] = {}
         cursor = None
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute("SELECT student_name, record FROM attendance WHERE date = %s", (date,))
-            results = cursor.fetchall()
+            cursor = self.connection.cursor()
+            cursor.execute(self._SQL_ASSETS_LIKE, params)
+            for asset_name, borrower, class_, borrowed_at, returned_at in cursor.fetchall():
+                assets[asset_name] = {
+                    'borrower': borrower or '',
+                    'class': class_ or '',
+                    'borrowed_at': str(borrowed_at) if borrowed_at else '',
+                    'returned_at': str(returned_at) if returned_at else '',
+                }
+        except Error as e:
+            logger.error(f"Error getting assets: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+        return assets
+
+    def return_asset(self, asset_name: str, returned_at: str) -> bool:
+        if not self.connection:
+            return False
+        
+        cursor = None
+        try:
+            # A single conditional UPDATE: zero affected rows means the asset
+            # is unknown or was already returned.
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "UPDATE assets SET returned_at = %s "
+                "WHERE asset_name = %s AND returned_at IS NULL",
+                (returned_at, asset_name)
+            )
+            return cursor.rowcount > 0
+        except Error as e:
+            logger.error(f"Error returning asset {asset_name}: {e}")
+            return False
+        finally:
+            if cursor:
+                cursor.close()
+
+    def return_assets(self, asset_names: List[str], returned_at: str) -> List[str]:
+        """
+        Mark several borrowed assets as returned in one transaction.
+        
+        Args:
+            asset_names (List[str]): Assets to return
+            returned_at (str): Return timestamp
             
-            attendance = {}
-            for result in results:
-                if isinstance(result, dict) and 'record' in result and 'student_name' in result:
-                    attendance[str(result['student_name'])] = json.loads(str(result['record']))
+        Returns:
+            List[str]: Names of the assets that were returned
+        """
+        return self._asset_batch(
+            asset_names,
+            "UPDATE assets SET returned_at = %s WHERE asset_name = %s AND returned_at IS NULL",
+            lambda name: (returned_at, name), "returning assets"
+        )
+
+    def delete_assets(self, asset_names: List[str]) -> List[str]:
+        """
+        Delete several asset records in one transaction.
+        
+        Args:
+            asset_names (List[str]): Assets to delete
             
-            return attendance
+        Returns:
+            List[str]: Names of the assets that were deleted
+        """
+        return self._asset_batch(
+            asset_names, "DELETE FROM assets WHERE asset_name = %s",
+            lambda name: (name,), "deleting assets"
+        )
+
+    def _asset_batch(self, asset_names: List[str], query: str, params, context: str) -> List[str]:
+        """
+        Run a per-asset statement for every name inside a single transaction.
+        
+        executemany() would only report the total row count, so the statement
+        is executed per name on one cursor to learn which assets it affected;
+        all of them still share one commit.
+        
+        Args:
+            asset_names (List[str]): Assets to process
+            query (str): Statement affecting at most one asset
+            params: Callable mapping an asset name to the statement parameters
+            context (str): Description used in error messages
+            
+        Returns:
+            List[str]: Names of the assets the statement affected, empty on error
+        """
+        if not self.connection or not asset_names:
+            return []
+        
+        affected: List[str] = []
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            self.connection.start_transaction()
+            for name in asset_names:
+                cursor.execute(query, params(name))
+                if cursor.rowcount > 0:
+                    affected.append(name)
+            self.connection.commit()
+            return affected
         except Error as e:
-            logger.error(f"Error getting attendance for {date}: {e}")
-            return {}
+            logger.error(f"Error {context}: {e}")
+            self._rollback()
+            return []
+        finally:
+            if cursor:
+                cursor.close()
+
+    def bulk_upsert_assets(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> bool:
+        """
+        Insert or update many asset records with multi-row INSERTs.
+        
+        Rows are grouped into statements that stay below the server's
+        max_allowed_packet, so a catalog import costs one round trip per
+        chunk instead of one per asset.
+        
+        Args:
+            items (Iterable[Tuple[str, Dict[str, Any]]]): (asset_name, record) pairs,
+                where record has borrower, class, borrowed_at and returned_at keys
+                
+        Returns:
+            bool: True if all chunks were written successfully, False otherwise
+        """
+        if not self.connection:
+            return False
+        
+        prefix = "INSERT INTO assets (asset_name, borrower, class, borrowed_at, returned_at) VALUES "
+        suffix = (" ON DUPLICATE KEY UPDATE borrower = VALUES(borrower), class = VALUES(class), "
+                  "borrowed_at = VALUES(borrowed_at), returned_at = VALUES(returned_at)")
+        row_sql = "(%s, %s, %s, %s, %s)"
+        # Leave headroom for quoting/escaping and the protocol header
+        budget = int(self._max_packet * 0.8) - len(prefix) - len(suffix)
+        
+        def flush_chunk(cursor, rows: List[Tuple[Any, ...]]) -> None:
+            cursor.execute(prefix + ", ".join([row_sql] * len(rows)) + suffix,
+                           tuple(value for row in rows for value in row))
+        
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            self.connection.start_transaction()
+            chunk: List[Tuple[Any, ...]] = []
+            chunk_size = 0
+            for asset_name, record in items:
+                row = (
+                    asset_name,
+                    record.get("borrower") or None,
+                    record.get("class") or None,
+                    record.get("borrowed_at") or None,
+                    record.get("returned_at") or None,
+                )
+                row_size = len(row_sql) + 2 + sum(len(str(v)) * 2 for v in row if v is not None)
+                if chunk and chunk_size + row_size > budget:
+                    flush_chunk(cursor, chunk)
+                    chunk, chunk_size = [], 0
+                chunk.append(row)
+                chunk_size += row_size
+            if chunk:
+                flush_chunk(cursor, chunk)
+            self.connection.commit()
+            return True
+        except Error as e:
+            logger.error(f"Error bulk upserting assets: {e}")
+            self._rollback()
+            return False
         finally:
             if cursor:
                 cursor.close()
@@ -42,6 +42,9 @@ class DatabaseManager:
         self.face_encodings: List[Any] = []
         self.face_names: List[str] = []
         self.trained_people: Set[str] = set()
+        self._sorted_student_names: Optional[List[str]] = None  # cache for list_student_names()
+        self.student_version = 0  # bumped by invalidate_student_cache()
+        self.assets_version = 0  # bumped whenever asset_database changes
         self.attendance_database: Dict[str, Dict[str, Dict[str, Any]]] = {}  # date -> {student -> record}
         
         # Repair corrupted pickle files if any
@@ -70,7 +73,6 @@ class DatabaseManager:
             if os.path.exists(file_path):
                 try:
                     with open(file_path, "rb") as f:
-                        import pickle
                         pickle.load(f)
                 except Exception as e:
                     logger.error(f"Corrupted pickle file detected: {file_path}. Error: {e}")
@@ -147,6 +149,7 @@ class DatabaseManager:
                     # Add all trained names to the set
                     for name in self.face_names:
                         self.trained_people.add(name)
+                    self.invalidate_student_cache()
                 logger.info(f"Loaded {len(self.face_encodings)} face encodings")
                 logger.info(f"People already in the model: {', '.join(sorted(list(self.trained_people)))}")
             except Exception as e:
@@ -162,55 +165,107 @@ class DatabaseManager:
         return self.asset_database
 
     def borrow_asset(self, asset_name, borrower, classes, borrowed_at):
+        return bool(self.borrow_assets([(asset_name, borrower, classes, borrowed_at)]))
+
+    def return_asset(self, asset_name, returned_at):
+        return bool(self.return_assets([asset_name], returned_at))
+
+    def delete_asset(self, asset_name):
+        """Delete an asset record from the database."""
+        return bool(self.delete_assets([asset_name]))
+
+    def borrow_assets(self, items: List[Tuple[str, str, str, str]]) -> List[str]:
+        """
+        Record several borrows and save the asset database once.
+        
+        Assets that are currently borrowed and not yet returned are skipped.
+        
+        Args:
+            items (List[Tuple[str, str, str, str]]): (asset_name, borrower, class, borrowed_at) tuples
+            
+        Returns:
+            List[str]: Names of the assets that were borrowed
+        """
         if not hasattr(self, 'asset_database'):
             self.asset_database = {}
-        record = self.asset_database.get(asset_name, {})
-        if record.get('borrowed_at') and not record.get('returned_at'):
-            return False  # Already borrowed and not returned
-        self.asset_database[asset_name] = {
-            'borrower': borrower,
-            'class': classes,
-            'borrowed_at': borrowed_at,
-            'returned_at': ''
-        }
-        self.save_asset_database()
-        return True
+        borrowed = []
+        for asset_name, borrower, classes, borrowed_at in items:
+            record = self.asset_database.get(asset_name, {})
+            if record.get('borrowed_at') and not record.get('returned_at'):
+                continue  # Already borrowed and not returned
+            self.asset_database[asset_name] = {
+                'borrower': borrower,
+                'class': classes,
+                'borrowed_at': borrowed_at,
+                'returned_at': ''
+            }
+            borrowed.append(asset_name)
+        if borrowed:
+            self.assets_version += 1
+            self.save_asset_database()
+        return borrowed
 
-    def return_asset(self, asset_name, returned_at):
+    def return_assets(self, asset_names: List[str], returned_at: str) -> List[str]:
+        """
+        Mark several assets as returned and save the asset database once.
+        
+        Args:
+            asset_names (List[str]): Assets to return
+            returned_at (str): Return timestamp
+            
+        Returns:
+            List[str]: Names of the assets that were borrowed and are now returned
+        """
         if not hasattr(self, 'asset_database'):
             self.asset_database = {}
-        record = self.asset_database.get(asset_name)
-        if not record or record.get('returned_at'):
-            return False  # Not borrowed or already returned
-        self.asset_database[asset_name]['returned_at'] = returned_at
-        self.save_asset_database()
-        return True
+        returned = []
+        for asset_name in asset_names:
+            record = self.asset_database.get(asset_name)
+            if not record or record.get('returned_at'):
+                continue  # Not borrowed or already returned
+            record['returned_at'] = returned_at
+            returned.append(asset_name)
+        if returned:
+            self.assets_version += 1
+            self.save_asset_database()
+        return returned
 
-    def delete_asset(self, asset_name):
-        """Delete an asset record from the database."""
+    def delete_assets(self, asset_names: List[str]) -> List[str]:
+        """
+        Delete several asset records and save the asset database once.
+        
+        Args:
+            asset_names (List[str]): Assets to delete
+            
+        Returns:
+            List[str]: Names of the assets that existed and were deleted
+        """
         if not hasattr(self, 'asset_database'):
             self.asset_database = {}
-        if asset_name in self.asset_database:
-            del self.asset_database[asset_name]
+        deleted = []
+        for asset_name in asset_names:
+            if asset_name in self.asset_database:
+                del self.asset_database[asset_name]
+                deleted.append(asset_name)
+        if deleted:
+            self.assets_version += 1
             self.save_asset_database()
-            return True
-        return False
+        return deleted
 
     def save_asset_database(self):
-        import os, pickle
         asset_db_file = os.path.join(self.base_dir, 'trained_model', 'asset_database.pickle')
         os.makedirs(os.path.dirname(asset_db_file), exist_ok=True)
         with open(asset_db_file, 'wb') as f:
             pickle.dump(self.asset_database, f)
 
     def load_asset_database(self):
-        import os, pickle
         asset_db_file = os.path.join(self.base_dir, 'trained_model', 'asset_database.pickle')
         if os.path.exists(asset_db_file):
             with open(asset_db_file, 'rb') as f:
                 self.asset_database = pickle.load(f)
         else:
             self.asset_database = {}
+        self.assets_version += 1
     
     def save_student_database(self) -> bool:
         """
@@ -282,6 +337,7 @@ class DatabaseManager:
             bool: True if saved successfully, False otherwise
         """
         self.student_database[name] = data
+        self.invalidate_student_cache()
         return self.save_student_database()
     
     def get_student_info(self, name: str) -> Optional[Dict[str, Any]]:
@@ -296,6 +352,57 @@ class DatabaseManager:
         """
         return self.student_database.get(name)
     
+    def invalidate_student_cache(self) -> None:
+        """
+        Mark student-derived caches as stale.
+        
+        Drops the sorted name cache and bumps ``student_version`` so views
+        that memoize student lists know to rebuild them.
+        """
+        self._sorted_student_names = None
+        self.student_version += 1
+    
+    def reload(self) -> None:
+        """
+        Refresh state derived from the in-memory databases after a bulk change.
+        
+        Training and the other writers keep the in-memory dictionaries and
+        lists current, so storage is not re-read. The trained-people set is
+        rebuilt in place from the face names, so existing references to it
+        stay valid, and the student caches are invalidated once.
+        """
+        self.trained_people.clear()
+        self.trained_people.update(self.face_names)
+        self.invalidate_student_cache()
+    
+    def list_student_names(self) -> List[str]:
+        """
+        Get the names of all trained students in sorted order.
+        
+        The sorted list is cached and only rebuilt after the set of trained
+        people changes.
+        
+        Returns:
+            List[str]: Sorted student names
+        """
+        if self._sorted_student_names is None:
+            self._sorted_student_names = sorted(self.trained_people)
+        return list(self._sorted_student_names)
+    
+    def get_student_field(self, name: str, field: str) -> Optional[str]:
+        """
+        Get a single field of a student's information.
+        
+        Args:
+            name (str): Student name
+            field (str): Field name (e.g. "class")
+            
+        Returns:
+            Optional[str]: Field value as a string, or None if not set
+        """
+        value = self.student_database.get(name, {}).get(field)
+        return None if value is None else str(value)
+    
     def add_rfid_card(self, card_id: str, person_name: str) -> bool:
         """
         Add or update RFID card.
@@ -308,6 +415,7 @@ class DatabaseManager:
             bool: True if saved successfully, False otherwise
         """
         self.rfid_database[card_id] = person_name
+        self.invalidate_student_cache()
         return self.save_rfid_database()
     
     def remove_rfid_card(self, card_id: str) -> bool:
@@ -322,6 +430,7 @@ class DatabaseManager:
         """
         if card_id in self.rfid_database:
             del self.rfid_database[card_id]
+            self.invalidate_student_cache()
             return self.save_rfid_database()
         return False
     
@@ -354,6 +463,7 @@ class DatabaseManager:
         # Update trained people set
         for name in new_names:
             self.trained_people.add(name)
+        self.invalidate_student_cache()
             
         return self.save_face_encodings()
     
@@ -364,13 +474,12 @@ class DatabaseManager:
         Returns:
             Set[str]: Set of person names
         """
-        dataset_people = set()
-        if os.path.exists(self.dataset_dir):
-            for item in os.listdir(self.dataset_dir):
-                person_dir = os.path.join(self.dataset_dir, item)
-                if os.path.isdir(person_dir):
-                    dataset_people.add(item)
-        return dataset_people
+        # scandir gives the entry type without an extra stat per item
+        try:
+            with os.scandir(self.dataset_dir) as entries:
+                return {entry.name for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
     
     def get_new_persons_to_train(self) -> Set[str]:
         """
@@ -392,15 +501,16 @@ class DatabaseManager:
             List[str]: List of image file paths
         """
         person_dir = os.path.join(self.dataset_dir, person_name)
-        image_files = []
-        
-        if os.path.exists(person_dir) and os.path.isdir(person_dir):
-            image_files = [
-                os.path.join(person_dir, f) for f in os.listdir(person_dir)
-                if f.lower().endswith(('.jpg', '.jpeg', '.png'))
-            ]
         
-        return image_files
+        # Let scandir fail instead of checking exists/isdir up front
+        try:
+            with os.scandir(person_dir) as entries:
+                return [
+                    entry.path for entry in entries
+                    if entry.name.lower().endswith(('.jpg', '.jpeg', '.png'))
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
 
     def _load_attendance_database(self) -> None:
         """Load attendance database from disk."""
@@ -517,6 +627,7 @@ class DatabaseManager:
                 self.face_encodings = new_encodings
                 self.face_names = new_names
                 self.trained_people.remove(student_name)
+                self.invalidate_student_cache()
                 
                 # Save the updated face encodings
                 if not self.save_face_encodings():
@@ -526,6 +637,7 @@ class DatabaseManager:
             # Step 2: Remove from student database
             if student_name in self.student_database:
                 del self.student_database[student_name]
+                self.invalidate_student_cache()
                 if not self.save_student_database():
                     logger.error(f"Failed to save student database after deleting {student_name}")
                     return False
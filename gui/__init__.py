@@ -1,9 +1,35 @@
 """
 GUI package initialization.
+
+Names are resolved lazily (PEP 562) so that importing ``gui`` does not
+load every dialog and tab module up front.
 """
 
-from gui.main_window import FaceRecognitionGUI
-from gui.dialogs import *
-from gui.tabs import *
+import importlib
+
+_LAZY_ATTRS = {
+    'FaceRecognitionGUI': 'gui.main_window',
+    'NewCardDialog': 'gui.dialogs.card_dialogs',
+    'ExistingCardDialog': 'gui.dialogs.card_dialogs',
+    'StudentInfoDialog': 'gui.dialogs.student_dialogs',
+    'RecognitionTab': 'gui.tabs.recognition_tab',
+    'CaptureTab': 'gui.tabs.capture_tab',
+    'TrainingTab': 'gui.tabs.training_tab',
+    'StudentRFIDTab': 'gui.tabs.student_rfid_tab',
+    'AntiSpoofingTab': 'gui.tabs.anti_spoofing_tab',
+    'SettingsTab': 'gui.tabs.settings_tab',
+    'DatabaseTab': 'gui.tabs.database_tab',
+    'RFIDTab': 'gui.tabs.rfid_tab',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ['FaceRecognitionGUI']
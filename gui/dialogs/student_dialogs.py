@@ -33,7 +33,7 @@ class StudentInfoDialog(QDialog):
         
         # Create student selection combo box
         self.student_combo = QComboBox()
-        self.student_combo.addItems(sorted(list(self.face_system.trained_people)))
+        self.student_combo.addItems(self.face_system.db_manager.list_student_names())
         form_layout.addRow("Select Student:", self.student_combo)
         
         # Create class input field
@@ -74,10 +74,8 @@ class StudentInfoDialog(QDialog):
         Args:
             student_name (str): Selected student name
         """
-        if student_name in self.face_system.student_database:
-            self.class_input.setText(self.face_system.student_database[student_name].get("class", ""))
-        else:
-            self.class_input.setText("")
+        class_name = self.face_system.db_manager.get_student_field(student_name, "class")
+        self.class_input.setText(class_name or "")
     
     def save_info(self):
         """Save student information."""
@@ -88,14 +86,11 @@ class StudentInfoDialog(QDialog):
             QMessageBox.warning(self, "Warning", "Class name cannot be empty.")
             return
         
-        # Update database
-        if student_name not in self.face_system.student_database:
-            self.face_system.student_database[student_name] = {}
-        
-        self.face_system.student_database[student_name]["class"] = class_name
-        
-        # Save the updated database
-        self.face_system.db_manager.save_student_database()
+        # Update and save the database; update_student_info also invalidates
+        # the views that cache student data (borrower list, RFID index)
+        student_info = dict(self.face_system.student_database.get(student_name, {}))
+        student_info["class"] = class_name
+        self.face_system.db_manager.update_student_info(student_name, student_info)
         
         QMessageBox.information(self, "Success", f"Updated {student_name}'s class to {class_name}")
         self.accept()
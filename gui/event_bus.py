@@ -0,0 +1,22 @@
+"""
+Application-wide event bus for communication between the main window and its tabs.
+"""
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class AppEventBus(QObject):
+    """
+    Central hub for cross-tab events.
+    
+    Producers (tabs and the RFID server thread) are forwarded into the bus
+    once, and each consumer connects to the bus signal it cares about,
+    instead of wiring every producer to every consumer.
+    """
+    
+    capture_completed = pyqtSignal(bool, str)  # Success flag, person name
+    training_completed = pyqtSignal(bool)  # Success flag
+    rfid_mode_changed = pyqtSignal(str)  # Mode ('identify' or 'add_edit')
+    rfid_detected_batch = pyqtSignal(list)  # [(identifier, is_new_card), ...]
+    rfid_status = pyqtSignal(str)  # RFID status message
+    db_reloaded = pyqtSignal()  # In-memory database contents changed
@@ -2,20 +2,135 @@
 Modified main GUI window to use combined Student & RFID tab.
 """
 
-from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget, QLabel, QMessageBox, QCheckBox
-from PyQt5.QtCore import Qt
+import importlib
+import os
+import re
+import time
+import weakref
+
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QTabWidget, QLabel, QMessageBox, QCheckBox
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QColor, QPalette
 
 from utils.logger import logger
-from gui.tabs.recognition_tab import RecognitionTab
-from gui.tabs.capture_tab import CaptureTab
-from gui.tabs.training_tab import TrainingTab
-from gui.tabs.student_rfid_tab import StudentRFIDTab
-from gui.tabs.anti_spoofing_tab import AntiSpoofingTab
-from gui.tabs.settings_tab import SettingsTab
-from gui.tabs.attendance_tab import AttendanceTab
-from gui.dialogs.card_dialogs import NewCardDialog, ExistingCardDialog
 from threads.rfid_thread import RFIDServerThread
-from gui.tabs.asset_management_tab import AssetManagementTab
+from gui.event_bus import AppEventBus
+
+def _tab_class(module_name, class_name):
+    """
+    Import a tab class from the gui.tabs package.
+    
+    Args:
+        module_name (str): Module name within gui.tabs
+        class_name (str): Tab class name
+        
+    Returns:
+        type: Tab class
+    """
+    return getattr(importlib.import_module(f"gui.tabs.{module_name}"), class_name)
+
+
+# Directory holding the .qss style sheets
+_STYLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles")
+
+
+def _minify_qss(style_sheet):
+    """
+    Strip comments and collapse whitespace in a style sheet.
+    
+    Args:
+        style_sheet (str): Style sheet source
+        
+    Returns:
+        str: Equivalent, shorter style sheet
+    """
+    style_sheet = re.sub(r"/\*.*?\*/", "", style_sheet, flags=re.S)
+    return re.sub(r"\s+", " ", style_sheet).strip()
+
+
+def _load_style_sheet(file_name):
+    """
+    Read a style sheet from the styles directory, minified for parsing.
+    
+    Args:
+        file_name (str): Style sheet file name
+        
+    Returns:
+        str: Style sheet contents, or an empty string if it cannot be read
+    """
+    try:
+        with open(os.path.join(_STYLES_DIR, file_name), "r", encoding="utf-8") as f:
+            return _minify_qss(f.read())
+    except OSError as e:
+        logger.error(f"Error loading style sheet {file_name}: {e}")
+        return ""
+
+
+# The application style sheet takes its colors from the palette except for
+# the button hover and pressed colors, so switching between light and dark
+# mode only swaps the palette and the small dark.qss override on the main
+# window. Both sheets are read once per process, at import.
+_STYLE_SHEET = _load_style_sheet("base.qss")
+_DARK_STYLE_SHEET = _load_style_sheet("dark.qss")
+
+# Palette colors per mode, by color role
+_PALETTE_COLORS = {
+    False: {
+        QPalette.Window: "#f0f0f0",
+        QPalette.WindowText: "#222222",
+        QPalette.Base: "#ffffff",
+        QPalette.AlternateBase: "#f5f5f5",
+        QPalette.Text: "#222222",
+        QPalette.Button: "#e0e0e0",
+        QPalette.ButtonText: "#222222",
+        QPalette.Light: "#ffffff",
+        QPalette.Midlight: "#e0e0e0",
+        QPalette.Mid: "#cccccc",
+        QPalette.Dark: "#a0a0a0",
+        QPalette.Shadow: "#696969",
+        QPalette.Highlight: "#4a86e8",
+        QPalette.HighlightedText: "#ffffff",
+    },
+    True: {
+        QPalette.Window: "#232629",
+        QPalette.WindowText: "#e0e0e0",
+        QPalette.Base: "#2d2f31",
+        QPalette.AlternateBase: "#282b30",
+        QPalette.Text: "#e0e0e0",
+        QPalette.Button: "#2d2f31",
+        QPalette.ButtonText: "#e0e0e0",
+        QPalette.Light: "#232629",
+        QPalette.Midlight: "#444444",
+        QPalette.Mid: "#444444",
+        QPalette.Dark: "#1a1c1e",
+        QPalette.Shadow: "#0f1011",
+        QPalette.Highlight: "#3a76d8",
+        QPalette.HighlightedText: "#ffffff",
+    },
+}
+
+# Palettes built so far, by dark mode flag
+_palettes = {}
+
+
+def _get_palette(dark_mode):
+    """
+    Get the light or dark palette, building it on first use.
+    
+    Args:
+        dark_mode (bool): True for the dark palette
+        
+    Returns:
+        QPalette: Palette for the mode
+    """
+    palette = _palettes.get(dark_mode)
+    if palette is None:
+        palette = QPalette()
+        for role, color in _PALETTE_COLORS[dark_mode].items():
+            palette.setColor(role, QColor(color))
+        _palettes[dark_mode] = palette
+    return palette
+
 
 class FaceRecognitionGUI(QMainWindow):
     """
@@ -23,8 +138,18 @@ class FaceRecognitionGUI(QMainWindow):
     
     This class is responsible for creating the main window and tabs,
     and handling the interaction between them.
+    
+    Tabs are created lazily: each starts as a placeholder and is replaced
+    by the real widget through _ensure_tab, so a tab attribute such as
+    capture_tab is None until that tab has been shown.
     """
     
+    # Coalesced RFID status message, fanned out to the tabs that display it
+    rfid_status_changed = pyqtSignal(str)
+    
+    # Seconds within which a repeated status message is dropped as a duplicate
+    STATUS_REPEAT_WINDOW = 0.5
+    
     def __init__(self, face_system):
         """
         Initialize the main window.
@@ -41,6 +166,24 @@ class FaceRecognitionGUI(QMainWindow):
         # Create RFID server thread
         self.rfid_server = RFIDServerThread(face_system)
         
+        # "Train now?" prompt shown after a capture, created on first use
+        self._train_prompt = None
+        
+        # Status messages waiting for the next _flush_status
+        self._pending_status = None
+        self._pending_rfid_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(33)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # Status channel -> (last message, time.monotonic() it arrived), so
+        # update_status and update_rfid_status deduplicate independently
+        self._last_status = {}
+        
+        # Central bus for events shared between the window and its tabs
+        self.event_bus = AppEventBus(self)
+        
         # Set up the main window
         self.setWindowTitle("Face Recognition System with RFID and Anti-Spoofing")
         self.setMinimumSize(1200, 800)
@@ -52,30 +195,51 @@ class FaceRecognitionGUI(QMainWindow):
         # Create tab widget
         self.tabs = QTabWidget()
         
-        # Create tabs
-        self.recognition_tab = RecognitionTab(self.face_system)
-        self.capture_tab = CaptureTab(self.face_system)
-        self.training_tab = TrainingTab(self.face_system)
-        self.student_rfid_tab = StudentRFIDTab(self.face_system, self)
-        self.anti_spoofing_tab = AntiSpoofingTab(self.face_system)
-        self.attendance_tab = AttendanceTab(self.face_system.db_manager, self)
-        self.settings_tab = SettingsTab(self.face_system)
-        self.asset_management_tab = AssetManagementTab(self.face_system.db_manager, self)
-        
-        # Add tabs to tab widget
-        self.tabs.addTab(self.recognition_tab, "Face Recognition")
-        self.tabs.addTab(self.capture_tab, "Capture Dataset")
-        self.tabs.addTab(self.training_tab, "Train Model")
-        self.tabs.addTab(self.student_rfid_tab, "Student & RFID Management")
-        self.tabs.addTab(self.asset_management_tab, "Asset Management")
-        self.tabs.addTab(self.anti_spoofing_tab, "Anti-Spoofing")
-        self.tabs.addTab(self.attendance_tab, "Attendance")
-        self.tabs.addTab(self.settings_tab, "Settings")
-        
-        # Now connect RFID server signals (after self.student_rfid_tab is created)
-        self.rfid_server.rfid_detected.connect(self.student_rfid_tab.handle_rfid_detection)
-        self.rfid_server.rfid_detected.connect(self.asset_management_tab.handle_rfid_detected)
-        self.rfid_server.update_status.connect(self.update_rfid_status)
+        # Every tab starts as a placeholder so the window can paint at once.
+        # The default tab and the tabs that receive RFID events are built on
+        # the first event-loop tick (see _late_init); the others are built
+        # the first time they are shown (see _ensure_tab).
+        self.recognition_tab = None
+        self.student_rfid_tab = None
+        self.asset_management_tab = None
+        self.capture_tab = None
+        self.training_tab = None
+        self.anti_spoofing_tab = None
+        self.attendance_tab = None
+        self.settings_tab = None
+        # Set once _late_init has connected the tab signals
+        self._signals_connected = False
+        
+        # Tab index -> (attribute name, factory) for tabs not built yet. The
+        # tab modules are imported by the factories, so importing this module
+        # does not pull in every tab and its dependencies.
+        # Tabs that only need the database get a weak proxy to it, so they
+        # never keep it alive or form reference cycles with it.
+        self._db = self.face_system.db_manager
+        db_manager = weakref.proxy(self._db)
+        self._lazy_tabs = {
+            0: ("recognition_tab", lambda: _tab_class("recognition_tab", "RecognitionTab")(self.face_system)),
+            1: ("capture_tab", lambda: _tab_class("capture_tab", "CaptureTab")(self.face_system)),
+            2: ("training_tab", lambda: _tab_class("training_tab", "TrainingTab")(self.face_system)),
+            3: ("student_rfid_tab", lambda: _tab_class("student_rfid_tab", "StudentRFIDTab")(self.face_system, self)),
+            4: ("asset_management_tab", lambda: _tab_class("asset_management_tab", "AssetManagementTab")(db_manager, self)),
+            5: ("anti_spoofing_tab", lambda: _tab_class("anti_spoofing_tab", "AntiSpoofingTab")(self.face_system)),
+            6: ("attendance_tab", lambda: _tab_class("attendance_tab", "AttendanceTab")(db_manager, self)),
+            7: ("settings_tab", lambda: _tab_class("settings_tab", "SettingsTab")(self.face_system)),
+        }
+        
+        # Add placeholder tabs to tab widget, laying the tab bar out once
+        self.tabs.setUpdatesEnabled(False)
+        self.tabs.addTab(QWidget(), "Face Recognition")
+        self.tabs.addTab(QWidget(), "Capture Dataset")
+        self.tabs.addTab(QWidget(), "Train Model")
+        self.tabs.addTab(QWidget(), "Student & RFID Management")
+        self.tabs.addTab(QWidget(), "Asset Management")
+        self.tabs.addTab(QWidget(), "Anti-Spoofing")
+        self.tabs.addTab(QWidget(), "Attendance")
+        self.tabs.addTab(QWidget(), "Settings")
+        self.tabs.setUpdatesEnabled(True)
+        self.tabs.currentChanged.connect(self._ensure_tab)
         
         # Create main layout and add tab widget
         main_layout = QVBoxLayout()
@@ -94,216 +258,199 @@ class FaceRecognitionGUI(QMainWindow):
         # Set layout for central widget
         self.central_widget.setLayout(main_layout)
         
+        # Single 30 Hz tick that paints video frames for the current tab
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(33)
+        self._ui_timer.timeout.connect(self._on_tick)
+        
+        # Finish setup once the window skeleton has been shown
+        QTimer.singleShot(0, self._late_init)
+    
+    def _late_init(self):
+        """Build the always-present tabs, apply styling and connect signals."""
+        # Swap in all three tabs before the tab widget repaints
+        self.tabs.setUpdatesEnabled(False)
+        for index in (0, 3, 4):
+            self._ensure_tab(index)
+        self.tabs.setUpdatesEnabled(True)
+        
         # Set style sheet for modern look
         self.set_style_sheet()
         
         # Connect signals from tabs
         self._connect_signals()
         
+        self._ui_timer.start()
+        
         logger.info("GUI initialized")
     
+    @pyqtSlot()
+    def _on_tick(self):
+        """Paint the newest video frame of the current tab, if it has one."""
+        tab = self.tabs.currentWidget()
+        video_thread = getattr(tab, "video_thread", None)
+        if video_thread is None:
+            return
+        frame = video_thread.latest_frame()
+        if frame is not None:
+            # The image borrows the buffer's memory; holding ``buffer`` here
+            # keeps it alive until update_frame has made its pixmap.
+            image, buffer = frame
+            tab.update_frame(image)
+            del buffer
+    
     def _connect_signals(self):
         """Connect signals from tabs to handle inter-tab communication."""
-        # Connect capture complete signal to training tab
-        self.capture_tab.capture_completed.connect(self.handle_capture_completed)
+        bus = self.event_bus
+        
+        # Forward producers into the bus. RFID server signals are queued
+        # explicitly so the server thread never waits on a GUI handler.
+        self.rfid_server.rfid_detected_batch.connect(bus.rfid_detected_batch, Qt.QueuedConnection)
+        self.rfid_server.update_status.connect(bus.rfid_status, Qt.QueuedConnection)
+        self.student_rfid_tab.mode_changed.connect(bus.rfid_mode_changed)
+        
+        # Connect consumers to the bus, once per signal
+        bus.rfid_detected_batch.connect(self.student_rfid_tab.handle_rfid_batch)
+        bus.rfid_detected_batch.connect(self.asset_management_tab.handle_rfid_batch)
+        bus.rfid_status.connect(self.update_rfid_status)
+        bus.rfid_mode_changed.connect(self.set_rfid_mode)
+        bus.capture_completed.connect(self.handle_capture_completed)
+        bus.training_completed.connect(self.handle_training_completed)
+        bus.db_reloaded.connect(self.student_rfid_tab.handle_db_reloaded)
+        bus.db_reloaded.connect(self.asset_management_tab.handle_db_reloaded)
+        if self.attendance_tab is not None:
+            bus.db_reloaded.connect(self.attendance_tab.handle_db_reloaded)
+        
+        self.rfid_status_changed.connect(self.recognition_tab.update_rfid_status)
+        self.rfid_status_changed.connect(self.student_rfid_tab.update_status)
+        self._signals_connected = True
+    
+    def _disconnect_signals(self):
+        """Disconnect the event bus so queued events are not delivered after shutdown."""
+        # The window can be closed before _late_init has run
+        if not self._signals_connected:
+            return
+        self._signals_connected = False
+        bus = self.event_bus
+        producers = [
+            (self.rfid_server.rfid_detected_batch, bus.rfid_detected_batch),
+            (self.rfid_server.update_status, bus.rfid_status),
+            (self.student_rfid_tab.mode_changed, bus.rfid_mode_changed),
+        ]
+        if self.capture_tab is not None:
+            producers.append((self.capture_tab.capture_completed, bus.capture_completed))
+        if self.training_tab is not None:
+            producers.append((self.training_tab.training_completed, bus.training_completed))
+        
+        for signal, target in producers:
+            try:
+                signal.disconnect(target)
+            except TypeError:
+                pass  # Not connected
+        
+        for signal in (bus.capture_completed, bus.training_completed, bus.rfid_mode_changed,
+                       bus.rfid_detected_batch, bus.rfid_status, bus.db_reloaded):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # No connections left
+        
+        try:
+            self.rfid_status_changed.disconnect()
+        except TypeError:
+            pass  # Not connected
+    
+    def _connect_tab_signals(self, tab):
+        """
+        Forward the signals of a tab built by _ensure_tab into the event bus.
+        
+        Args:
+            tab: Newly built tab widget
+        """
+        if tab is self.capture_tab:
+            self.capture_tab.capture_completed.connect(self.event_bus.capture_completed)
+        elif tab is self.training_tab:
+            self.training_tab.training_completed.connect(self.event_bus.training_completed)
+        elif tab is self.attendance_tab and self._signals_connected:
+            # Built after _connect_signals ran, so subscribe it here
+            self.event_bus.db_reloaded.connect(self.attendance_tab.handle_db_reloaded)
+    
+    @pyqtSlot(int)
+    def _ensure_tab(self, index):
+        """
+        Build a lazily created tab the first time it is needed.
+        
+        Args:
+            index (int): Tab index
+            
+        Returns:
+            QWidget: The tab widget at index
+        """
+        entry = self._lazy_tabs.pop(index, None)
+        if entry is None:
+            return self.tabs.widget(index)
         
-        # Connect training complete signal to database tab
-        self.training_tab.training_completed.connect(self.handle_training_completed)
+        attr_name, factory = entry
+        tab = factory()
+        setattr(self, attr_name, tab)
         
-        # Connect RFID mode signal from RFID tab
-        self.student_rfid_tab.mode_changed.connect(self.set_rfid_mode)
+        # Swap the placeholder for the real tab without re-entering this slot
+        current = self.tabs.currentIndex()
+        placeholder = self.tabs.widget(index)
+        title = self.tabs.tabText(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, title)
+        self.tabs.setCurrentIndex(current)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        self._connect_tab_signals(tab)
+        logger.info(f"Tab '{title}' initialized")
+        return tab
     
     def set_style_sheet(self, dark_mode=False):
         """Set style sheet for modern or dark look."""
-        if dark_mode:
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #232629;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #444;
-                    background-color: #232629;
-                    border-radius: 5px;
-                }
-                QTabBar::tab {
-                    background-color: #2d2f31;
-                    border: 1px solid #444;
-                    border-bottom: none;
-                    border-top-left-radius: 4px;
-                    border-top-right-radius: 4px;
-                    padding: 8px 12px;
-                    margin-right: 2px;
-                    color: #e0e0e0;
-                }
-                QTabBar::tab:selected {
-                    background-color: #232629;
-                    border-bottom: 1px solid #232629;
-                    color: #fff;
-                }
-                QPushButton {
-                    background-color: #3a76d8;
-                    color: #fff;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                }
-                QPushButton:hover {
-                    background-color: #295bb5;
-                }
-                QPushButton:pressed {
-                    background-color: #1a3d7a;
-                }
-                QPushButton:disabled {
-                    background-color: #444;
-                    color: #888;
-                }
-                QLabel, QGroupBox, QCheckBox, QRadioButton, QAbstractItemView, QMenuBar, QMenu, QStatusBar {
-                    color: #e0e0e0;
-                }
-                QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit, QPlainTextEdit {
-                    border: 1px solid #444;
-                    border-radius: 4px;
-                    padding: 6px;
-                    background-color: #2d2f31;
-                    color: #e0e0e0;
-                    selection-background-color: #3a76d8;
-                    selection-color: #fff;
-                }
-                QProgressBar {
-                    border: 1px solid #444;
-                    border-radius: 4px;
-                    background-color: #232629;
-                    text-align: center;
-                    color: #e0e0e0;
-                }
-                QProgressBar::chunk {
-                    background-color: #3a76d8;
-                    border-radius: 3px;
-                }
-                QTableWidget, QTableView {
-                    border: 1px solid #444;
-                    border-radius: 4px;
-                    background-color: #232629;
-                    gridline-color: #444;
-                    color: #e0e0e0;
-                    selection-background-color: #3a76d8;
-                    selection-color: #fff;
-                    alternate-background-color: #282b30;
-                }
-                QTableWidget::item, QTableView::item {
-                    padding: 4px;
-                }
-                QTableWidget::item:selected, QTableView::item:selected {
-                    background-color: #3a76d8;
-                    color: #fff;
-                }
-                QHeaderView::section {
-                    background-color: #2d2f31;
-                    padding: 6px;
-                    border: 1px solid #444;
-                    border-left: none;
-                    border-top: none;
-                    color: #e0e0e0;
-                }
-                QScrollBar:vertical, QScrollBar:horizontal {
-                    background: #232629;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #f0f0f0;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #cccccc;
-                    background-color: #ffffff;
-                    border-radius: 5px;
-                }
-                QTabBar::tab {
-                    background-color: #e0e0e0;
-                    border: 1px solid #cccccc;
-                    border-bottom: none;
-                    border-top-left-radius: 4px;
-                    border-top-right-radius: 4px;
-                    padding: 8px 12px;
-                    margin-right: 2px;
-                    color: #222;
-                }
-                QTabBar::tab:selected {
-                    background-color: #ffffff;
-                    border-bottom: 1px solid #ffffff;
-                    color: #111;
-                }
-                QPushButton {
-                    background-color: #4a86e8;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                }
-                QPushButton:hover {
-                    background-color: #3a76d8;
-                }
-                QPushButton:pressed {
-                    background-color: #2a66c8;
-                }
-                QPushButton:disabled {
-                    background-color: #cccccc;
-                    color: #888888;
-                }
-                QLabel, QGroupBox, QCheckBox, QRadioButton, QAbstractItemView, QMenuBar, QMenu, QStatusBar {
-                    color: #222;
-                }
-                QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit, QPlainTextEdit {
-                    border: 1px solid #cccccc;
-                    border-radius: 4px;
-                    padding: 6px;
-                    background-color: white;
-                    color: #222;
-                    selection-background-color: #4a86e8;
-                    selection-color: #fff;
-                }
-                QProgressBar {
-                    border: 1px solid #cccccc;
-                    border-radius: 4px;
-                    background-color: #f0f0f0;
-                    text-align: center;
-                    color: #222;
-                }
-                QProgressBar::chunk {
-                    background-color: #4a86e8;
-                    border-radius: 3px;
-                }
-                QTableWidget, QTableView {
-                    border: 1px solid #cccccc;
-                    border-radius: 4px;
-                    background-color: white;
-                    gridline-color: #e0e0e0;
-                    color: #222;
-                    selection-background-color: #e0e0ff;
-                    selection-color: #111;
-                    alternate-background-color: #f5f5f5;
-                }
-                QTableWidget::item, QTableView::item {
-                    padding: 4px;
-                }
-                QTableWidget::item:selected, QTableView::item:selected {
-                    background-color: #e0e0ff;
-                    color: #111;
-                }
-                QHeaderView::section {
-                    background-color: #e0e0e0;
-                    padding: 6px;
-                    border: 1px solid #cccccc;
-                    border-left: none;
-                    border-top: none;
-                    color: #222;
-                }
-                QScrollBar:vertical, QScrollBar:horizontal {
-                    background: #f0f0f0;
-                }
-            """)
+        app = QApplication.instance()
+        app.setPalette(_get_palette(dark_mode))
+        
+        # The base sheet is the same in both modes and is set on the
+        # application, so it is parsed once and shared by every window and
+        # dialog. Re-applying it would still restyle every widget.
+        if app.styleSheet() != _STYLE_SHEET:
+            app.setStyleSheet(_STYLE_SHEET)
+        
+        # Dark mode only overrides the button hover and pressed colors, on
+        # this window's widgets
+        override = _DARK_STYLE_SHEET if dark_mode else ""
+        if self.styleSheet() != override:
+            self.setStyleSheet(override)
+    
+    def _is_repeat(self, channel, message):
+        """
+        Check whether ``message`` repeats the last one on ``channel`` within STATUS_REPEAT_WINDOW.
+        
+        A message repeated after the window has passed is a new event, such
+        as the same card being scanned again, and is not treated as a repeat.
+        
+        Args:
+            channel (str): Status channel
+            message (str): Status message
+            
+        Returns:
+            bool: True if the message should be dropped
+        """
+        now = time.monotonic()
+        last = self._last_status.get(channel)
+        if (last is not None and last[0] == message
+                and now - last[1] < self.STATUS_REPEAT_WINDOW):
+            return True
+        # Timed from the last shown message, so a steady stream of repeats
+        # still gets through once per window
+        self._last_status[channel] = (message, now)
+        return False
     
+    @pyqtSlot(str)
     def update_status(self, message):
         """
         Update status bar message.
@@ -311,9 +458,26 @@ class FaceRecognitionGUI(QMainWindow):
         Args:
             message (str): Status message
         """
-        self.status_label.setText(message)
+        # A burst of the same message changes nothing on screen and needs no new log line
+        if self._is_repeat("status", message):
+            return
+        self._show_status(message)
+    
+    def _show_status(self, message):
+        """
+        Schedule a status bar update and log the message.
+        
+        Args:
+            message (str): Status message
+        """
+        # Repaint at most ~30 times a second; the latest message wins
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+        
         logger.info(message)
     
+    @pyqtSlot(str)
     def update_rfid_status(self, message):
         """
         Update RFID status.
@@ -321,10 +485,23 @@ class FaceRecognitionGUI(QMainWindow):
         Args:
             message (str): RFID status message
         """
-        self.recognition_tab.update_rfid_status(message)
-        self.student_rfid_tab.update_status(message)
-        self.update_status(message)
+        if self._is_repeat("rfid", message):
+            return
+        
+        self._pending_rfid_status = message
+        self._show_status(message)
+    
+    @pyqtSlot()
+    def _flush_status(self):
+        """Show the latest pending status messages."""
+        if self._pending_status is not None:
+            self.status_label.setText(self._pending_status)
+            self._pending_status = None
+        if self._pending_rfid_status is not None:
+            message, self._pending_rfid_status = self._pending_rfid_status, None
+            self.rfid_status_changed.emit(message)
     
+    @pyqtSlot(str)
     def set_rfid_mode(self, mode):
         """
         Set RFID operation mode.
@@ -338,6 +515,7 @@ class FaceRecognitionGUI(QMainWindow):
         mode_text = "Identify" if mode == "identify" else "Add/Edit"
         self.update_rfid_status(f"RFID Mode: {mode_text}")
     
+    @pyqtSlot(bool, str)
     def handle_capture_completed(self, success, person_name):
         """
         Handle capture completion.
@@ -347,17 +525,32 @@ class FaceRecognitionGUI(QMainWindow):
             person_name (str): Person name
         """
         if success:
-            # Ask if user wants to train the model now
-            reply = QMessageBox.question(
-                self, "Train Model", 
-                "Do you want to train the model with the new dataset now?",
-                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
-            )
-            
-            if reply == QMessageBox.Yes:
-                self.tabs.setCurrentIndex(2)  # Switch to training tab
-                self.training_tab.start_training()
+            # Ask if user wants to train the model now. The prompt is window
+            # modal but does not block in a nested event loop, so queued RFID
+            # and status events keep flowing while the user decides.
+            if self._train_prompt is None:
+                self._train_prompt = QMessageBox(
+                    QMessageBox.Question, "Train Model",
+                    "Do you want to train the model with the new dataset now?",
+                    QMessageBox.Yes | QMessageBox.No, self
+                )
+                self._train_prompt.setDefaultButton(QMessageBox.Yes)
+                self._train_prompt.finished.connect(self._on_train_prompt_finished)
+            self._train_prompt.open()
+    
+    @pyqtSlot(int)
+    def _on_train_prompt_finished(self, result):
+        """
+        Start training if the user accepted the train prompt.
+        
+        Args:
+            result (int): Button the prompt was closed with
+        """
+        if result == QMessageBox.Yes:
+            self.tabs.setCurrentIndex(2)  # Switch to training tab
+            self._ensure_tab(2).start_training()
     
+    @pyqtSlot(bool)
     def handle_training_completed(self, success):
         """
         Handle training completion.
@@ -366,11 +559,12 @@ class FaceRecognitionGUI(QMainWindow):
             success (bool): True if training was successful
         """
         if success:
-            # Refresh database tab
-            self.student_rfid_tab.refresh_database()
-            # Refresh RFID tab person combo
-            self.student_rfid_tab.refresh_person_combo()
+            # Refresh the derived student caches once, then let every tab
+            # that shows student data rebuild from the same snapshot
+            self._db.reload()
+            self.event_bus.db_reloaded.emit()
     
+    @pyqtSlot(int)
     def toggle_dark_mode(self, state):
         self.set_style_sheet(dark_mode=bool(state))
     
@@ -381,21 +575,29 @@ class FaceRecognitionGUI(QMainWindow):
         Args:
             event: Close event
         """
-        # Stop video threads in tabs
-        self.recognition_tab.stop_recognition()
-        self.capture_tab.stop_capture()
+        # Ask every running thread to stop before waiting on any of them, so
+        # shutdown takes as long as the slowest thread rather than the sum
+        threads = [self.rfid_server]
+        for tab in (self.recognition_tab, self.capture_tab, self.anti_spoofing_tab):
+            # video_thread is None until the tab starts one
+            if tab is not None and tab.video_thread is not None:
+                threads.append(tab.video_thread)
+        running = [thread for thread in threads if thread.isRunning()]
+        for thread in running:
+            thread.stop()
+        for thread in running:
+            thread.wait()
         
-        # Stop anti-spoofing test if running
-        if hasattr(self.anti_spoofing_tab, 'video_thread') and self.anti_spoofing_tab.video_thread and self.anti_spoofing_tab.video_thread.isRunning():
+        # Reset tab controls now that their video threads have finished
+        if self.recognition_tab is not None:
+            self.recognition_tab.stop_recognition()
+        if self.capture_tab is not None:
+            self.capture_tab.stop_capture()
+        if self.anti_spoofing_tab is not None and self.anti_spoofing_tab.video_thread in running:
             self.anti_spoofing_tab.stop_live_test()
         
-        # Stop RFID server
-        if self.rfid_server.isRunning():
-            self.rfid_server.stop()
-            self.rfid_server.wait()
-        
         # Check if training is in progress
-        if self.training_tab.is_training:
+        if self.training_tab is not None and self.training_tab.is_training:
             reply = QMessageBox.question(
                 self, "Training in Progress", 
                 "Training is still in progress. Do you want to wait for it to complete?",
@@ -405,5 +607,16 @@ class FaceRecognitionGUI(QMainWindow):
             if reply == QMessageBox.Yes:
                 self.training_tab.wait_for_training()
         
+        self._disconnect_signals()
+        
+        # Release the tab widget trees now rather than leaving them to the
+        # cyclic garbage collector at interpreter shutdown
+        self._ui_timer.stop()
+        self._status_timer.stop()
+        built_tabs = [self.tabs.widget(i) for i in range(self.tabs.count())]
+        self.tabs.clear()
+        for tab in built_tabs:
+            tab.deleteLater()
+        
         logger.info("Application closing")
         event.accept()
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+Helpers shared by the table-based tabs.
+"""
+
+from contextlib import contextmanager
+
+
+@contextmanager
+def with_table_frozen(table):
+    """
+    Suspend painting, signals and sorting of a table view while it is repopulated.
+
+    The previous states are restored on exit and the viewport is repainted
+    once, so a bulk update costs a single layout and paint pass.
+
+    Args:
+        table: QTableView (or QTableWidget) being updated
+    """
+    updates_enabled = table.updatesEnabled()
+    sorting_enabled = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    signals_blocked = table.blockSignals(True)
+    table.setSortingEnabled(False)
+    try:
+        yield table
+    finally:
+        table.setSortingEnabled(sorting_enabled)
+        table.blockSignals(signals_blocked)
+        table.setUpdatesEnabled(updates_enabled)
+        table.viewport().update()
@@ -1,17 +1,33 @@
 """
 Updated tabs package initialization to include student_rfid_tab.
+
+Tab classes are resolved lazily (PEP 562), so importing one tab module
+does not import every other tab along with it.
 """
 
-from gui.tabs.recognition_tab import RecognitionTab
-from gui.tabs.capture_tab import CaptureTab
-from gui.tabs.training_tab import TrainingTab
-from gui.tabs.student_rfid_tab import StudentRFIDTab
-from gui.tabs.anti_spoofing_tab import AntiSpoofingTab
-from gui.tabs.settings_tab import SettingsTab
+import importlib
+
+_LAZY_ATTRS = {
+    'RecognitionTab': 'gui.tabs.recognition_tab',
+    'CaptureTab': 'gui.tabs.capture_tab',
+    'TrainingTab': 'gui.tabs.training_tab',
+    'StudentRFIDTab': 'gui.tabs.student_rfid_tab',
+    'AntiSpoofingTab': 'gui.tabs.anti_spoofing_tab',
+    'SettingsTab': 'gui.tabs.settings_tab',
+    # Keep these for backward compatibility
+    'DatabaseTab': 'gui.tabs.database_tab',
+    'RFIDTab': 'gui.tabs.rfid_tab',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-# Keep these imports for backward compatibility
-from gui.tabs.database_tab import DatabaseTab
-from gui.tabs.rfid_tab import RFIDTab
 
 __all__ = [
     'RecognitionTab',
@@ -22,4 +38,4 @@ __all__ = [
     'SettingsTab',
     'DatabaseTab',
     'RFIDTab'
-]
\ No newline at end of file
+]
@@ -7,19 +7,178 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                            QTabWidget, QTextEdit, QProgressBar, QMessageBox,
                            QGroupBox, QComboBox, QRadioButton, QFileDialog)
 from PyQt5.QtGui import QPixmap, QImage
-from PyQt5.QtCore import Qt, pyqtSignal, QThread
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QObject, QRunnable, QThread, QThreadPool
 
 import face_recognition
 import cv2
 import numpy as np
-from threading import Thread
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
 import time
 import os
 
 from core.video_stream import VideoStream
-from threads.video_thread import VideoThread
+from threads.video_thread import LatestFrame, VideoThread
 from utils.logger import logger
 
+# Lets QImage read OpenCV's BGR buffers directly; missing before Qt 5.14
+_FORMAT_BGR888 = getattr(QImage, "Format_BGR888", None)
+
+# "0%" .. "100%", so live labels are concatenated rather than formatted per face
+_PCT = tuple(f"{i}%" for i in range(101))
+
+
+def _percent_text(score):
+    """
+    Get the percentage label of a score in [0, 1].
+    
+    Args:
+        score (float): Score
+        
+    Returns:
+        str: Score as a whole percentage, e.g. "87%"
+    """
+    return _PCT[min(100, max(0, int(score * 100)))]
+
+
+def _bgr_to_qimage(bgr_image):
+    """
+    Wrap a BGR image in a QImage without an OpenCV color conversion.
+    
+    The returned image shares memory with bgr_image when Qt supports
+    Format_BGR888 (Qt 5.14+), so the array must outlive it.
+    
+    Args:
+        bgr_image (numpy.ndarray): BGR image
+        
+    Returns:
+        QImage: Image for display
+    """
+    h, w = bgr_image.shape[:2]
+    if _FORMAT_BGR888 is not None:
+        return QImage(bgr_image.data, w, h, bgr_image.strides[0], _FORMAT_BGR888)
+    return QImage(bgr_image.data, w, h, bgr_image.strides[0], QImage.Format_RGB888).rgbSwapped()
+
+
+def _detect_faces(rgb_image, model, scale=1.0):
+    """
+    Detect faces on a downscaled copy of an image.
+    
+    Args:
+        rgb_image (numpy.ndarray): RGB image
+        model (str): face_recognition detection model ('hog' or 'cnn')
+        scale (float): Factor the image is resized by before detection
+        
+    Returns:
+        list: (top, right, bottom, left) face locations in full-resolution coordinates
+    """
+    if scale >= 1.0:
+        return face_recognition.face_locations(rgb_image, model=model)
+    
+    small = cv2.resize(rgb_image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return _scale_locations(face_recognition.face_locations(small, model=model),
+                            scale, rgb_image.shape)
+
+
+def _scale_locations(face_locations, scale, shape):
+    """
+    Map face locations found on a downscaled image back to full resolution.
+    
+    Args:
+        face_locations (list): (top, right, bottom, left) locations on the small image
+        scale (float): Factor the image was resized by
+        shape (tuple): Shape of the full-resolution image
+        
+    Returns:
+        list: (top, right, bottom, left) face locations in full-resolution coordinates
+    """
+    if scale >= 1.0:
+        return face_locations
+    height, width = shape[:2]
+    return [
+        (int(top / scale), min(width, int(right / scale)),
+         min(height, int(bottom / scale)), int(left / scale))
+        for (top, right, bottom, left) in face_locations
+    ]
+
+
+def _crop_faces(frame, face_locations, size, out=None):
+    """
+    Resize the faces of a BGR frame to a common size as RGB crops.
+    
+    Args:
+        frame (numpy.ndarray): BGR frame
+        face_locations (list): (top, right, bottom, left) face locations
+        size (tuple): (width, height) of each crop
+        out (numpy.ndarray, optional): (N, H, W, 3) uint8 buffer with room for every face
+        
+    Returns:
+        numpy.ndarray: (N, H, W, 3) array, one crop per face
+    """
+    n_faces = len(face_locations)
+    width, height = size
+    if out is None:
+        out = np.empty((n_faces, height, width, 3), dtype=np.uint8)
+    
+    for i, (top, right, bottom, left) in enumerate(face_locations):
+        crop = out[i]
+        cv2.resize(frame[top:bottom, left:right], (width, height),
+                   dst=crop, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(crop, cv2.COLOR_BGR2RGB, dst=crop)
+    return out[:n_faces]
+
+
+def _draw_metrics(frame, metrics, left, top):
+    """
+    Draw the anti-spoofing metrics of one face above its box.
+    
+    Args:
+        frame (numpy.ndarray): BGR frame to draw on
+        metrics (SpoofingMetrics): Metadata returned by is_real_face
+        left (int): Left edge of the face box
+        top (int): Top edge of the face box
+    """
+    if metrics.moire_score is None:
+        return  # Face was not scored
+    cv2.putText(frame, f"moire_score: {metrics.moire_score:.2f}", (left, top - 20),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+    cv2.putText(frame, f"lighting_consistency: {metrics.lighting_consistency:.2f}", (left, top),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+    cv2.putText(frame, f"texture_score: {metrics.texture_score:.2f}", (left, top + 20),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+
+
+class _ModelDownloadSignals(QObject):
+    """Signals emitted by _ModelDownloadWorker."""
+    finished = pyqtSignal(bool, str)
+
+
+class _ModelDownloadWorker(QRunnable):
+    """
+    Downloads and reloads the anti-spoofing models on a thread pool thread.
+    
+    The outcome is delivered through ``signals.finished`` as
+    (success, status message).
+    """
+    
+    def __init__(self, anti_spoofing):
+        super().__init__()
+        self.anti_spoofing = anti_spoofing
+        self.signals = _ModelDownloadSignals()
+    
+    def run(self):
+        try:
+            # Call the download method
+            self.anti_spoofing._check_and_download_models()
+            
+            # Reload models
+            self.anti_spoofing._load_models()
+        except Exception as e:
+            self.signals.finished.emit(False, f"Error updating models: {e}")
+            return
+        self.signals.finished.emit(True, "Models updated successfully")
+
+
 class AntiSpoofingTab(QWidget):
     """
     Tab for anti-spoofing testing and management.
@@ -38,10 +197,25 @@ class AntiSpoofingTab(QWidget):
         super().__init__()
         self.face_system = face_system
         self.video_thread = None
+        self.test_image_data = None  # Image loaded for image mode
+        self._download_worker = None
         self.test_mode = "live"  # 'live' or 'image'
         
         # Initialize UI components
         self._init_ui()
+        
+        # Size live frames are scaled to; refreshed in resizeEvent
+        self._live_target_size = self.live_video_label.size()
+    
+    def resizeEvent(self, event):
+        """
+        Remember the new live video size so update_frame need not query it per frame.
+        
+        Args:
+            event (QResizeEvent): Resize event
+        """
+        super().resizeEvent(event)
+        self._live_target_size = self.live_video_label.size()
     
     def _init_ui(self):
         """Initialize UI components."""
@@ -200,8 +374,24 @@ class AntiSpoofingTab(QWidget):
         self.spoofing_threshold_spin.setSingleStep(0.05)
         self.spoofing_threshold_spin.setValue(self.face_system.anti_spoofing.spoofing_detection_threshold)
         
+        # Trade detection accuracy for live test FPS
+        self.detect_every_combo = QComboBox()
+        for n in (1, 2, 3, 4):
+            self.detect_every_combo.addItem("Every frame" if n == 1 else f"Every {n} frames", n)
+        self.detect_every_combo.setCurrentIndex(1)
+        self.detect_every_combo.currentIndexChanged.connect(self.on_detect_every_changed)
+        
         settings_layout.addRow("Enable Anti-Spoofing:", self.enable_anti_spoofing_check)
         settings_layout.addRow("Detection Threshold:", self.spoofing_threshold_spin)
+        # Detection cost grows with pixel count, so detect on a smaller copy
+        self.detection_scale_combo = QComboBox()
+        for scale in (0.25, 0.5, 1.0):
+            self.detection_scale_combo.addItem(f"{int(scale * 100)}%", scale)
+        self.detection_scale_combo.setCurrentIndex(1)
+        self.detection_scale_combo.currentIndexChanged.connect(self.on_detection_scale_changed)
+        
+        settings_layout.addRow("Live Detection:", self.detect_every_combo)
+        settings_layout.addRow("Detection Resolution:", self.detection_scale_combo)
         
         # Add information about how anti-spoofing works
         info_text = """
@@ -275,6 +465,26 @@ class AntiSpoofingTab(QWidget):
         tab.setLayout(layout)
         return tab
     
+    def on_detect_every_changed(self, index):
+        """
+        Apply the live detection interval, also to a running live test.
+        
+        Args:
+            index (int): Index of the selected interval
+        """
+        if self.video_thread is not None:
+            self.video_thread.set_detect_every(self.detect_every_combo.itemData(index))
+    
+    def on_detection_scale_changed(self, index):
+        """
+        Apply the detection resolution, also to a running live test.
+        
+        Args:
+            index (int): Index of the selected scale
+        """
+        if self.video_thread is not None:
+            self.video_thread.set_detection_scale(self.detection_scale_combo.itemData(index))
+    
     def update_frame(self, image):
         """
         Update video frame in the current mode.
@@ -283,12 +493,10 @@ class AntiSpoofingTab(QWidget):
             image (QImage): Frame to display
         """
         if self.test_mode == "live":
-            pixmap = QPixmap.fromImage(image)
+            # Nearest-neighbour scaling is good enough for live preview
+            pixmap = QPixmap.fromImage(image, Qt.NoFormatConversion)
             self.live_video_label.setPixmap(pixmap.scaled(
-                self.live_video_label.width(), 
-                self.live_video_label.height(), 
-                Qt.KeepAspectRatio
-            ))
+                self._live_target_size, Qt.KeepAspectRatio, Qt.FastTransformation))
         
     def update_status(self, status):
         """
@@ -326,7 +534,8 @@ class AntiSpoofingTab(QWidget):
         
         # Create and start custom video thread for anti-spoofing testing
         self.video_thread = CustomVideoThread(self.face_system)
-        self.video_thread.update_frame.connect(self.update_frame)
+        self.video_thread.set_detect_every(self.detect_every_combo.currentData())
+        self.video_thread.set_detection_scale(self.detection_scale_combo.currentData())
         self.video_thread.update_status.connect(self.update_status)
         self.video_thread.start()
     
@@ -361,16 +570,14 @@ class AntiSpoofingTab(QWidget):
             self.test_image_data = image
             
             # Display image
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            h, w, ch = image_rgb.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(image_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
+            qt_image = _bgr_to_qimage(image)
             
             pixmap = QPixmap.fromImage(qt_image)
             self.image_label.setPixmap(pixmap.scaled(
                 self.image_label.width(), 
                 self.image_label.height(), 
-                Qt.KeepAspectRatio
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
             ))
             
             # Enable test button
@@ -384,7 +591,7 @@ class AntiSpoofingTab(QWidget):
     
     def test_image(self):
         """Test loaded image for anti-spoofing."""
-        if not hasattr(self, 'test_image_data'):
+        if self.test_image_data is None:
             self.update_status("No image loaded")
             return
         
@@ -403,24 +610,26 @@ class AntiSpoofingTab(QWidget):
         self.update_status("Analyzing image for spoofing attempts...")
         
         # Run in a separate thread
-        test_thread = Thread(target=self._process_test_image, args=(image, rgb_image))
+        scale = self.detection_scale_combo.currentData()
+        test_thread = Thread(target=self._process_test_image, args=(image, rgb_image, scale))
         test_thread.daemon = True
         test_thread.start()
         
         # Restore original threshold
         self.face_system.anti_spoofing.spoofing_detection_threshold = original_threshold
     
-    def _process_test_image(self, image, rgb_image):
+    def _process_test_image(self, image, rgb_image, scale=1.0):
         """
         Process test image in a separate thread.
         
         Args:
             image (numpy.ndarray): BGR image
             rgb_image (numpy.ndarray): RGB image
+            scale (float): Factor the image is resized by before face detection
         """
         try:
             # First detect faces using face_recognition
-            face_locations = face_recognition.face_locations(rgb_image, model=self.face_system.detection_method)
+            face_locations = _detect_faces(rgb_image, self.face_system.detection_method, scale)
             
             if not face_locations:
                 self.update_status("No faces detected in the image")
@@ -429,13 +638,15 @@ class AntiSpoofingTab(QWidget):
             # Create a copy to draw on
             result_image = image.copy()
             
+            # Get anti-spoofing results for all faces in one batched call,
+            # on crops sized like the live test's
+            face_imgs = _crop_faces(image, face_locations,
+                                    self.face_system.anti_spoofing.FACE_INPUT_SIZE)
+            spoofing_results = self.face_system.anti_spoofing.is_real_face_batch(face_imgs)
+            
             # Process each face
-            for i, (top, right, bottom, left) in enumerate(face_locations):
-                # Extract face
-                face_img = rgb_image[top:bottom, left:right]
-                
-                # Get anti-spoofing result
-                is_real, real_score, metadata = self.face_system.anti_spoofing.is_real_face(face_img)
+            for i, ((top, right, bottom, left), (is_real, real_score, metadata)) in enumerate(
+                    zip(face_locations, spoofing_results)):
                 
                 # Determine box color
                 if is_real:
@@ -458,24 +669,22 @@ class AntiSpoofingTab(QWidget):
                 self.update_status(f"Face {i+1}: {'REAL' if is_real else 'FAKE'} - Confidence: {int(real_score*100)}%")
                 
                 # Log metadata
-                if metadata:
-                    for key, value in metadata.items():
+                if metadata is not None:
+                    for key, value in metadata.to_dict().items():
                         if isinstance(value, float):
                             self.update_status(f"  {key}: {value:.3f}")
                         else:
                             self.update_status(f"  {key}: {value}")
             
             # Display result
-            result_rgb = cv2.cvtColor(result_image, cv2.COLOR_BGR2RGB)
-            h, w, ch = result_rgb.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(result_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
+            qt_image = _bgr_to_qimage(result_image)
             
             pixmap = QPixmap.fromImage(qt_image)
             self.image_label.setPixmap(pixmap.scaled(
                 self.image_label.width(), 
                 self.image_label.height(), 
-                Qt.KeepAspectRatio
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
             ))
             
             # Summary
@@ -494,41 +703,26 @@ class AntiSpoofingTab(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            # Run in a separate thread to avoid UI freezing
+            # Run on the thread pool to avoid UI freezing
             self.update_status("Downloading/updating models...")
             self.update_models_button.setEnabled(False)
             
-            download_thread = Thread(target=self._download_models)
-            download_thread.daemon = True
-            download_thread.start()
+            self._download_worker = _ModelDownloadWorker(self.face_system.anti_spoofing)
+            self._download_worker.signals.finished.connect(self._on_models_downloaded)
+            QThreadPool.globalInstance().start(self._download_worker)
     
-    def _download_models(self):
-        """Download models in a separate thread."""
-        try:
-            # Call the download method
-            self.face_system.anti_spoofing._check_and_download_models()
-            
-            # Reload models
-            self.face_system.anti_spoofing._load_models()
-            
-            # Update status
-            self.update_status("Models updated successfully")
-            
-            # Update UI from main thread
-            from PyQt5.QtCore import QMetaObject, Q_ARG, Qt
-            QMetaObject.invokeMethod(
-                self.update_models_button, "setEnabled", 
-                Qt.QueuedConnection, Q_ARG(bool, True)
-            )
-            
-        except Exception as e:
-            self.update_status(f"Error updating models: {e}")
-            # Re-enable button
-            from PyQt5.QtCore import QMetaObject, Q_ARG, Qt
-            QMetaObject.invokeMethod(
-                self.update_models_button, "setEnabled", 
-                Qt.QueuedConnection, Q_ARG(bool, True)
-            )
+    @pyqtSlot(bool, str)
+    def _on_models_downloaded(self, success, message):
+        """
+        Report the result of a model download and re-enable the button.
+        
+        Args:
+            success (bool): True if the models were updated
+            message (str): Status message
+        """
+        self._download_worker = None
+        self.update_models_button.setEnabled(True)
+        self.update_status(message)
     
     def save_anti_spoofing_settings(self):
         """Save anti-spoofing settings."""
@@ -547,15 +741,299 @@ class AntiSpoofingTab(QWidget):
         logger.info("Anti-spoofing settings saved")
 
 
+def _put_latest(q, item, on_drop=None):
+    """
+    Put an item on a bounded queue, dropping the oldest item if it is full.
+    
+    Args:
+        q (queue.Queue): Bounded queue
+        item: Item to put
+        on_drop (callable, optional): Called with each item dropped from the queue
+    """
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except Full:
+            try:
+                dropped = q.get_nowait()
+            except Empty:
+                continue
+            if on_drop is not None:
+                on_drop(dropped)
+
+
+class FramePool:
+    """
+    Free list of reusable frame buffers shared by the pipeline stages.
+    
+    A buffer belongs to whichever stage holds it until that stage releases
+    it: the capture worker acquires one per frame, and it comes back when a
+    queue drops the frame or LatestFrame is done with it. When every buffer
+    is in use acquire() returns None and the capture worker skips the frame,
+    so a buffer is never rewritten while a later stage still reads it.
+    """
+    
+    def __init__(self, size):
+        """
+        Initialize an empty pool.
+        
+        Args:
+            size (int): Maximum number of buffers allocated
+        """
+        self.size = size
+        self._free = Queue()
+        self._allocated = 0
+        self._lock = Lock()
+    
+    def acquire(self, like):
+        """
+        Get a free buffer shaped like ``like``, allocating one while below ``size``.
+        
+        Args:
+            like (numpy.ndarray): Frame the buffer must match in shape and dtype
+            
+        Returns:
+            Optional[numpy.ndarray]: Buffer owned by the caller, or None if all are in use
+        """
+        try:
+            buffer = self._free.get_nowait()
+        except Empty:
+            with self._lock:
+                if self._allocated >= self.size:
+                    return None
+                self._allocated += 1
+            return np.empty_like(like)
+        if buffer.shape != like.shape or buffer.dtype != like.dtype:
+            # The camera changed resolution; replace the stale buffer
+            buffer = np.empty_like(like)
+        return buffer
+    
+    def release(self, buffer):
+        """
+        Return a buffer to the pool once no stage uses it any more.
+        
+        Args:
+            buffer (numpy.ndarray): Buffer from acquire()
+        """
+        self._free.put(buffer)
+
+
+class CaptureWorker(Thread):
+    """
+    Pipeline stage that owns the camera and feeds mirrored frames to frame_q.
+    
+    Frames are mirrored into buffers acquired from a FramePool. A camera
+    frame is skipped while every buffer is still in use further down the
+    pipeline.
+    """
+    
+    def __init__(self, frame_q, stop_event, pool):
+        """
+        Initialize the capture worker.
+        
+        Args:
+            frame_q (queue.Queue): Bounded queue receiving BGR frames
+            stop_event (threading.Event): Set to stop the pipeline
+            pool (FramePool): Pool the frame buffers are taken from
+        """
+        super().__init__(daemon=True)
+        self.frame_q = frame_q
+        self.stop_event = stop_event
+        self.pool = pool
+    
+    def run(self):
+        vs = VideoStream(src=0, width=1280, height=720).start()
+        self.stop_event.wait(2.0)  # Allow camera to warm up
+        
+        last_frame = None
+        try:
+            while not self.stop_event.is_set():
+                # Read frame from threaded video stream
+                frame = vs.read()
+                if frame is None:
+                    break
+                if frame is last_frame:
+                    # The camera has not delivered a new frame yet
+                    time.sleep(0.002)
+                    continue
+                last_frame = frame
+                
+                # Mirror the image into a free buffer; skip the frame if the
+                # later stages still hold every buffer
+                dst = self.pool.acquire(frame)
+                if dst is None:
+                    continue
+                cv2.flip(frame, 1, dst=dst)
+                _put_latest(self.frame_q, dst, self.pool.release)
+        finally:
+            vs.stop()
+            self.stop_event.set()
+
+
+class InferenceWorker(Thread):
+    """
+    Pipeline stage that detects faces and runs anti-spoofing on them.
+    
+    Each frame from frame_q is passed on to render_q as
+    (frame, annotations, fresh). annotations is a list of
+    (face_location, spoofing_result) pairs where spoofing_result is None
+    if anti-spoofing is disabled. Detection only runs on every
+    detect_every-th frame; the frames in between reuse the last
+    annotations and are passed on with fresh set to False.
+    """
+    
+    # Faces checked per frame; further detections are dropped for that frame
+    MAX_FACES = 4
+    
+    def __init__(self, face_system, frame_q, render_q, stop_event, detect_every=1,
+                 detection_scale=1.0, pool=None):
+        """
+        Initialize the inference worker.
+        
+        Args:
+            face_system: Face recognition system
+            frame_q (queue.Queue): Bounded queue of BGR frames to analyze
+            render_q (queue.Queue): Bounded queue receiving (frame, annotations, fresh)
+            stop_event (threading.Event): Set to stop the pipeline
+            detect_every (int): Run detection on every Nth frame
+            detection_scale (float): Factor frames are resized by before face detection
+            pool (FramePool, optional): Pool that frames dropped from render_q are returned to
+        """
+        super().__init__(daemon=True)
+        self.face_system = face_system
+        self.frame_q = frame_q
+        self.render_q = render_q
+        self.stop_event = stop_event
+        self.detect_every = detect_every
+        self.detection_scale = detection_scale
+        self.pool = pool
+        self.last_results = []
+        
+        # Reused (N, H, W, 3) batch the face crops are resized into
+        self._crop_buf = None
+        
+        # Prepare detection images through OpenCV's transparent API (UMat)
+        self.use_opencl = (cv2.ocl.haveOpenCL()
+                           and face_system.config.get("use_opencl", True))
+    
+    def _release(self, item):
+        """Return the frame of a render_q item dropped unrendered to the pool."""
+        if self.pool is not None:
+            self.pool.release(item[0])
+    
+    def _detection_image(self, frame):
+        """
+        Convert a BGR frame to the downscaled RGB image faces are detected on.
+        
+        With OpenCL the conversion and resize run on a UMat and only the
+        small result is downloaded.
+        
+        Args:
+            frame (numpy.ndarray): BGR frame
+            
+        Returns:
+            numpy.ndarray: RGB image resized by detection_scale
+        """
+        src = cv2.UMat(frame) if self.use_opencl else frame
+        rgb = cv2.cvtColor(src, cv2.COLOR_BGR2RGB)
+        if self.detection_scale < 1.0:
+            rgb = cv2.resize(rgb, None, fx=self.detection_scale, fy=self.detection_scale,
+                             interpolation=cv2.INTER_AREA)
+        return rgb.get() if self.use_opencl else rgb
+    
+    def _crop_faces(self, frame, face_locations):
+        """
+        Resize the faces of a frame into the reused crop buffer as RGB.
+        
+        Args:
+            frame (numpy.ndarray): BGR frame
+            face_locations (list): (top, right, bottom, left) face locations
+            
+        Returns:
+            numpy.ndarray: (N, H, W, 3) view of the crop buffer, one crop per face
+        """
+        size = self.face_system.anti_spoofing.FACE_INPUT_SIZE
+        if self._crop_buf is None:
+            width, height = size
+            self._crop_buf = np.empty((self.MAX_FACES, height, width, 3), dtype=np.uint8)
+        return _crop_faces(frame, face_locations, size, self._crop_buf)
+    
+    def run(self):
+        frame_counter = 0
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    frame = self.frame_q.get(timeout=0.1)
+                except Empty:
+                    continue
+                
+                # Reuse the previous detections between inferences
+                frame_counter += 1
+                if frame_counter < max(1, self.detect_every):
+                    _put_latest(self.render_q, (frame, self.last_results, False), self._release)
+                    continue
+                frame_counter = 0
+                
+                # Detect faces on a downscaled RGB copy, boxes are in full resolution
+                small_rgb = self._detection_image(frame)
+                face_locations = _scale_locations(
+                    face_recognition.face_locations(small_rgb, model=self.face_system.detection_method),
+                    self.detection_scale, frame.shape)
+                
+                # Keep the largest, i.e. closest, faces if there are too many
+                if len(face_locations) > self.MAX_FACES:
+                    face_locations = sorted(
+                        face_locations,
+                        key=lambda loc: (loc[2] - loc[0]) * (loc[1] - loc[3]),
+                        reverse=True)[:self.MAX_FACES]
+                
+                # Check all faces of the frame in one batched anti-spoofing call
+                if self.face_system.enable_anti_spoofing:
+                    face_imgs = self._crop_faces(frame, face_locations)
+                    spoofing_results = self.face_system.anti_spoofing.is_real_face_batch(face_imgs)
+                else:
+                    spoofing_results = [None] * len(face_locations)
+                
+                self.last_results = list(zip(face_locations, spoofing_results))
+                _put_latest(self.render_q, (frame, self.last_results, True), self._release)
+        except Exception as e:
+            # Shut the whole pipeline down, as on camera loss, rather than
+            # leaving the other stages waiting on a dead stage
+            logger.error(f"Error in anti-spoofing inference: {e}")
+        finally:
+            self.stop_event.set()
+
+
 class CustomVideoThread(QThread):
     """
     Custom thread for anti-spoofing testing with detailed metrics.
+    
+    Capture, inference and rendering run as a three-stage pipeline:
+    a CaptureWorker and an InferenceWorker feed this thread, which draws
+    the overlays and hands finished frames to the GUI. The stages are
+    joined by queues of size 2 that drop their oldest frame when full.
     """
     
     # Define PyQt signals
-    update_frame = pyqtSignal(QImage)
     update_status = pyqtSignal(str)
     
+    # Capacity of the queues between the pipeline stages
+    QUEUE_SIZE = 2
+    
+    # Frame buffers in the pool: both queues, one frame in the inference
+    # worker, one in this thread, one in LatestFrame and one being painted
+    # by the GUI, plus one for the capture worker to write. Fewer would only
+    # make the capture worker skip frames.
+    FRAME_POOL_SIZE = 2 * QUEUE_SIZE + 5
+    
+    # Height of the face label sprites; the text baseline is 10 px above the face
+    LABEL_HEIGHT = 30
+    
+    # Size of the top-left overlay area drawn by _draw_hud
+    HUD_HEIGHT = 100
+    HUD_WIDTH = 480
+    
     def __init__(self, face_system):
         """
         Initialize the custom video thread.
@@ -566,22 +1044,165 @@ class CustomVideoThread(QThread):
         super().__init__()
         self.face_system = face_system
         self.running = False
+        
+        # Run face detection and anti-spoofing on every Nth frame only
+        self.detect_every = 2
+        self.detection_scale = 0.5
+        self._inference = None
+        
+        # Pre-rendered HUD sprite and mask, and the values it was drawn for
+        self._hud_cache = None
+        self._hud_key = None
+        
+        # Pre-rendered static face labels: (text, color) -> (sprite, mask, advance)
+        self._label_sprites = {}
+        
+        # Smoothed frame rate and the time of the last rendered frame
+        self._fps_ewma = 0.0
+        self._last_ns = 0
+        
+        # Frame buffers handed between the pipeline stages
+        self._pool = FramePool(self.FRAME_POOL_SIZE)
+        
+        # Newest frame for the GUI to display; see latest_frame(). Buffers
+        # return to the pool once the GUI is done with them.
+        self.frames = LatestFrame(self._pool.release)
+    
+    def set_detect_every(self, detect_every):
+        """
+        Set how often faces are detected; frames in between reuse the last result.
+        
+        Args:
+            detect_every (int): Run detection on every Nth frame
+        """
+        self.detect_every = detect_every
+        if self._inference is not None:
+            self._inference.detect_every = detect_every
+    
+    def set_detection_scale(self, detection_scale):
+        """
+        Set the factor frames are resized by before face detection.
+        
+        Args:
+            detection_scale (float): Scale factor, 1.0 for full resolution
+        """
+        self.detection_scale = detection_scale
+        if self._inference is not None:
+            self._inference.detection_scale = detection_scale
+    
+    def _draw_hud(self, frame, fps, anti_spoofing, real_faces, fake_faces):
+        """
+        Copy the FPS/status/counter overlay onto the top-left corner of a frame.
+        
+        The overlay is rasterized into a sprite only when one of its values
+        changes; other frames just copy the cached sprite's text pixels.
+        
+        Args:
+            frame (numpy.ndarray): BGR frame to draw on
+            fps (int): Frames per second
+            anti_spoofing (bool): Whether anti-spoofing is enabled
+            real_faces (int): Number of real faces seen
+            fake_faces (int): Number of fake faces seen
+        """
+        key = (fps, anti_spoofing, real_faces, fake_faces)
+        if self._hud_cache is None or key != self._hud_key:
+            hud = np.zeros((self.HUD_HEIGHT, self.HUD_WIDTH, 3), dtype=np.uint8)
+            cv2.putText(hud, f"FPS: {fps}", (30, 30), 
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+            anti_spoofing_text = "Anti-Spoofing: ON" if anti_spoofing else "Anti-Spoofing: OFF"
+            cv2.putText(hud, anti_spoofing_text, (30, 60), 
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0) if anti_spoofing else (0, 0, 255), 2)
+            if anti_spoofing:
+                cv2.putText(hud, f"Real: {real_faces}, Fake: {fake_faces}", (30, 90), 
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+            self._hud_cache = (hud, hud.any(axis=2))
+            self._hud_key = key
+        
+        hud, mask = self._hud_cache
+        h = min(self.HUD_HEIGHT, frame.shape[0])
+        w = min(self.HUD_WIDTH, frame.shape[1])
+        np.copyto(frame[:h, :w], hud[:h, :w], where=mask[:h, :w, None])
+    
+    def _label_sprite(self, text, color):
+        """
+        Get the pre-rendered sprite of a static face label, rendering it once.
+        
+        Args:
+            text (str): Label text
+            color (tuple): BGR text color
+            
+        Returns:
+            tuple: (sprite, mask of text pixels, text advance in pixels)
+        """
+        key = (text, color)
+        sprite = self._label_sprites.get(key)
+        if sprite is None:
+            (advance, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)
+            img = np.zeros((self.LABEL_HEIGHT, advance + 4, 3), dtype=np.uint8)
+            cv2.putText(img, text, (0, self.LABEL_HEIGHT - 10), 
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+            sprite = (img, img.any(axis=2), advance)
+            self._label_sprites[key] = sprite
+        return sprite
+    
+    def _draw_label(self, frame, label, suffix, color, left, top):
+        """
+        Draw a face label above its box.
+        
+        The static label is copied from a cached sprite; only the varying
+        suffix (e.g. the percentage) is rasterized with cv2.putText.
+        
+        Args:
+            frame (numpy.ndarray): BGR frame to draw on
+            label (str): Static part of the label, e.g. "REAL: "
+            suffix (str): Varying part of the label, may be empty
+            color (tuple): BGR text color
+            left (int): Left edge of the face box
+            top (int): Top edge of the face box
+        """
+        img, mask, advance = self._label_sprite(label, color)
+        y0 = top - self.LABEL_HEIGHT
+        if y0 < 0 or left < 0 or left + img.shape[1] > frame.shape[1]:
+            # Sprite would be clipped; let OpenCV clip the text instead
+            cv2.putText(frame, label + suffix, (left, top - 10), 
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+            return
+        
+        np.copyto(frame[y0:top, left:left + img.shape[1]], img, where=mask[:, :, None])
+        if suffix:
+            cv2.putText(frame, suffix, (left + advance, top - 10), 
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+    
+    def latest_frame(self):
+        """
+        Take the newest frame produced since the last call.
+        
+        Returns:
+            Optional[Tuple[QImage, np.ndarray]]: (image, backing buffer) to
+                display, or None if there is no new one
+        """
+        return self.frames.take()
     
     def run(self):
         """Run anti-spoofing test thread."""
         self.running = True
         
-        # Initialize video stream
+        # Start the capture and inference stages
         self.update_status.emit("Starting video stream...")
-        vs = VideoStream(src=0, width=1280, height=720).start()
-        time.sleep(2.0)  # Allow camera to warm up
-        
-        self.update_status.emit("Anti-spoofing test started")
-        
-        # For FPS calculation
-        fps_start = time.time()
-        fps_counter = 0
-        fps = 0
+        stop_event = Event()
+        frame_q = Queue(maxsize=self.QUEUE_SIZE)
+        render_q = Queue(maxsize=self.QUEUE_SIZE)
+        capture = CaptureWorker(frame_q, stop_event, self._pool)
+        inference = InferenceWorker(self.face_system, frame_q, render_q, stop_event,
+                                    self.detect_every, self.detection_scale, self._pool)
+        self._inference = inference
+        capture.start()
+        inference.start()
+        started = False
+        
+        # For FPS calculation: exponentially weighted average of 1/frame time
+        self._last_ns = time.monotonic_ns()
+        self._fps_ewma = 0.0
         
         # For metrics tracking
         detections = 0
@@ -589,101 +1210,76 @@ class CustomVideoThread(QThread):
         fake_faces = 0
         
         # Last metrics update time
-        last_metrics_time = time.time()
+        last_metrics_ns = self._last_ns
         
         while self.running:
-            # Read frame from threaded video stream
-            frame = vs.read()
-            if frame is None:
-                break
-                
-            # Mirror the image
-            frame = cv2.flip(frame, 1)
+            try:
+                frame, annotations, fresh = render_q.get(timeout=0.1)
+            except Empty:
+                if stop_event.is_set():
+                    break  # Camera stopped delivering frames
+                continue
             
-            # Calculate FPS
-            fps_counter += 1
-            if (time.time() - fps_start) >= 1.0:
-                fps = fps_counter
-                fps_counter = 0
-                fps_start = time.time()
+            if not started:
+                self.update_status.emit("Anti-spoofing test started")
+                started = True
             
-            # Convert BGR to RGB for face_recognition
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Detect faces
-            face_locations = face_recognition.face_locations(rgb_frame, model=self.face_system.detection_method)
+            # Calculate FPS
+            now_ns = time.monotonic_ns()
+            dt_ns = now_ns - self._last_ns
+            self._last_ns = now_ns
+            if dt_ns > 0:
+                self._fps_ewma = 0.9 * self._fps_ewma + 0.1 * (1e9 / dt_ns)
             
             # Process faces
-            for (top, right, bottom, left) in face_locations:
-                # Extract face region
-                face_img = rgb_frame[top:bottom, left:right]
-                
-                # Increment detection counter
-                detections += 1
+            for (top, right, bottom, left), spoofing_result in annotations:
+                # Increment detection counter, once per actual detection
+                if fresh:
+                    detections += 1
                 
                 # Perform anti-spoofing check if enabled
-                if self.face_system.enable_anti_spoofing:
+                if spoofing_result is not None:
                     # Check if this is a real face or a spoofing attempt
-                    is_real, real_score, metadata = self.face_system.anti_spoofing.is_real_face(face_img)
+                    is_real, real_score, metadata = spoofing_result
                     
                     # Update counters
                     if is_real:
-                        real_faces += 1
+                        if fresh:
+                            real_faces += 1
                         # Green for real face
                         color = (0, 255, 0)
-                        result_text = f"REAL: {int(real_score*100)}%"
+                        label, suffix = "REAL: ", _percent_text(real_score)
                     else:
-                        fake_faces += 1
+                        if fresh:
+                            fake_faces += 1
                         # Red for fake face
                         color = (0, 0, 255)
-                        result_text = f"FAKE: {int(real_score*100)}%"
+                        label, suffix = "FAKE: ", _percent_text(real_score)
                     
                     # Draw detailed metrics on frame
-                    if metadata:
-                        y_offset = top - 40
-                        for key, value in metadata.items():
-                            if isinstance(value, float) and key in ["moire_score", "lighting_consistency", "texture_score"]:
-                                y_offset += 20
-                                metric_text = f"{key}: {value:.2f}"
-                                cv2.putText(frame, metric_text, (left, y_offset), 
-                                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+                    if metadata is not None:
+                        _draw_metrics(frame, metadata, left, top)
                 else:
                     # No anti-spoofing, just show face detected
                     color = (0, 255, 255)
-                    result_text = "FACE DETECTED"
+                    label, suffix = "FACE DETECTED", ""
                 
                 # Draw rectangle around face
                 cv2.rectangle(frame, (left, top), (right, bottom), color, 2)
                 
                 # Draw result text
-                cv2.putText(frame, result_text, (left, top - 10), 
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
-            
-            # Show FPS counter
-            cv2.putText(frame, f"FPS: {fps}", (30, 30), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+                self._draw_label(frame, label, suffix, color, left, top)
             
-            # Show detection counters
-            anti_spoofing_text = "Anti-Spoofing: ON" if self.face_system.enable_anti_spoofing else "Anti-Spoofing: OFF"
-            cv2.putText(frame, anti_spoofing_text, (30, 60), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0) if self.face_system.enable_anti_spoofing else (0, 0, 255), 2)
+            # Show FPS counter and detection counters
+            self._draw_hud(frame, int(self._fps_ewma), self.face_system.enable_anti_spoofing,
+                           real_faces, fake_faces)
             
-            if self.face_system.enable_anti_spoofing:
-                cv2.putText(frame, f"Real: {real_faces}, Fake: {fake_faces}", (30, 90), 
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-            
-            # Convert to Qt format for display
-            rgb_frame_display = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_frame_display.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_frame_display.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            
-            # Emit signal to update UI
-            self.update_frame.emit(qt_image)
+            # Hand the frame and its buffer to the GUI; LatestFrame returns
+            # the buffer to the pool once the image is no longer displayed
+            self.frames.put(_bgr_to_qimage(frame), frame)
             
             # Periodically output metrics
-            current_time = time.time()
-            if current_time - last_metrics_time >= 5.0:  # Every 5 seconds
+            if now_ns - last_metrics_ns >= 5_000_000_000:  # Every 5 seconds
                 if self.face_system.enable_anti_spoofing:
                     real_percentage = 0 if detections == 0 else (real_faces / detections) * 100
                     fake_percentage = 0 if detections == 0 else (fake_faces / detections) * 100
@@ -692,12 +1288,12 @@ class CustomVideoThread(QThread):
                                           f"{real_faces} real ({real_percentage:.1f}%), "
                                           f"{fake_faces} fake ({fake_percentage:.1f}%)")
                 
-                last_metrics_time = current_time
-            
-            # Sleep to control frame rate
-            time.sleep(0.01)
+                last_metrics_ns = now_ns
         
-        vs.stop()
+        stop_event.set()
+        capture.join()
+        inference.join()
+        self._inference = None
         self.update_status.emit("Anti-spoofing test stopped")
     
     def stop(self):
@@ -2,30 +2,305 @@
 Asset management tab for tracking asset borrowing and returns.
 """
 
+from bisect import bisect_left
+from collections import defaultdict
+import time
 from datetime import datetime
+from gui.table_utils import with_table_frozen
+from utils.logger import logger
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QPushButton, QLabel, QLineEdit, QHeaderView, QMessageBox,
-    QComboBox, QDialog, QFormLayout, QMainWindow, QTabWidget
+    QComboBox, QDialog, QFormLayout, QMainWindow, QTabWidget, QAction
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer,
+    pyqtSignal, pyqtSlot
+)
+
+# (epoch second, formatted stamp) of the last _now_stamp() call
+_last_stamp = (None, "")
+
+
+def _now_stamp():
+    """Return the current local time as ``YYYY-MM-DD HH:MM:SS``, formatted at most once per second."""
+    global _last_stamp
+    second = int(time.time())
+    if _last_stamp[0] != second:
+        _last_stamp = (second, f"{datetime.fromtimestamp(second):%Y-%m-%d %H:%M:%S}")
+    return _last_stamp[1]
+
+
+class AssetRecord:
+    """Borrow state of one asset; a compact, slot-based stand-in for the stored record dict."""
+
+    __slots__ = ("borrower", "class_", "borrowed_at", "returned_at")
+
+    def __init__(self, borrower="", class_="", borrowed_at="", returned_at=""):
+        self.borrower = borrower
+        self.class_ = class_
+        self.borrowed_at = borrowed_at
+        self.returned_at = returned_at
+
+    @classmethod
+    def from_dict(cls, record, str_pool=None):
+        """
+        Build a record from a database dict.
+        
+        Borrower and class names repeat across many assets; routing them
+        through ``str_pool`` makes every record share one string object per
+        distinct value.
+        
+        Args:
+            record (dict): Asset record with borrower, class, borrowed_at and returned_at keys
+            str_pool (dict, optional): Shared str -> str pool
+            
+        Returns:
+            AssetRecord: The converted record
+        """
+        record = record or {}
+        borrower = str(record.get("borrower") or "")
+        class_ = str(record.get("class") or "")
+        if str_pool is not None:
+            intern = str_pool.setdefault
+            borrower = intern(borrower, borrower)
+            class_ = intern(class_, class_)
+        return cls(borrower, class_, str(record.get("borrowed_at") or ""),
+                   str(record.get("returned_at") or ""))
+
+    def to_dict(self):
+        """Return the record in the database's dict layout."""
+        return {
+            "borrower": self.borrower,
+            "class": self.class_,
+            "borrowed_at": self.borrowed_at,
+            "returned_at": self.returned_at,
+        }
+
+    def as_row(self, asset):
+        """Return the AssetTableModel row for ``asset``."""
+        return (asset, self.borrower, self.class_, self.borrowed_at, self.returned_at)
+
+
+# (field, column in an _assets_lc row) pairs covered by the trigram index
+_TRIGRAM_FIELDS = (('asset', 1), ('borrower', 2), ('class', 3))
+
+
+def _index_row(asset, record, intern):
+    """Build the (asset, asset_lc, borrower_lc, class_lc, record) filter row for one asset."""
+    borrower_lc = record.borrower.lower()
+    class_lc = record.class_.lower()
+    return (asset, str(asset).lower(), intern(borrower_lc, borrower_lc),
+            intern(class_lc, class_lc), record)
+
+
+def _add_trigrams(trigram_idx, row):
+    """Add every lowercase trigram of ``row``'s filter fields to the index."""
+    asset = row[0]
+    for field, col in _TRIGRAM_FIELDS:
+        text = row[col]
+        field_idx = trigram_idx[field]
+        for j in range(len(text) - 2):
+            field_idx[text[j:j + 3]].add(asset)
+
+
+def _remove_trigrams(trigram_idx, row):
+    """Remove ``row``'s asset from the index, dropping trigrams left empty."""
+    asset = row[0]
+    for field, col in _TRIGRAM_FIELDS:
+        text = row[col]
+        field_idx = trigram_idx[field]
+        for j in range(len(text) - 2):
+            trigram = text[j:j + 3]
+            names = field_idx.get(trigram)
+            if names is not None:
+                names.discard(asset)
+                if not names:
+                    del field_idx[trigram]
+
+
+def build_asset_index(assets, str_pool=None):
+    """
+    Build the filter structures for an asset dictionary.
+    
+    Args:
+        assets (dict): asset_name -> AssetRecord
+        str_pool (dict, optional): Shared str -> str pool for the lowercased
+            borrower and class keys
+        
+    Returns:
+        tuple: (assets_lc, trigram_idx) where assets_lc is a name-sorted list of
+            (asset, asset_lc, borrower_lc, class_lc, record) tuples and
+            trigram_idx maps each field to {lowercase trigram: set of asset names}
+    """
+    pool = str_pool if str_pool is not None else {}
+    intern = pool.setdefault
+    assets_lc = [_index_row(asset, record, intern) for asset, record in assets.items()]
+    assets_lc.sort(key=lambda row: row[0])
+    trigram_idx = {'asset': defaultdict(set), 'borrower': defaultdict(set), 'class': defaultdict(set)}
+    for row in assets_lc:
+        _add_trigrams(trigram_idx, row)
+    return assets_lc, trigram_idx
+
+
+class _AssetsSignals(QObject):
+    """Signals emitted by _AssetsLoader."""
+    loaded = pyqtSignal(int, object)
+
+
+class _AssetsLoader(QRunnable):
+    """
+    Fetches the asset dictionary and builds its filter index on a thread pool thread.
+    
+    The result is delivered through ``signals.loaded`` as
+    ``(generation, (assets, assets_lc, trigram_idx, str_pool, version))`` so
+    stale loads can be ignored; ``version`` is db_manager.assets_version as
+    read before the fetch, or None if the manager does not track one.
+    Each load interns into a fresh ``str_pool``, so strings of borrowers and
+    classes that have since disappeared are not kept alive.
+    """
+    
+    def __init__(self, db_manager, generation):
+        super().__init__()
+        self.db_manager = db_manager
+        self.generation = generation
+        self.str_pool = {}
+        self.signals = _AssetsSignals()
+    
+    def run(self):
+        try:
+            version = getattr(self.db_manager, 'assets_version', None)
+            assets = self.db_manager.get_assets() if hasattr(self.db_manager, 'get_assets') else {}
+            # Snapshot so GUI-thread edits can't change the dict while it is
+            # indexed; the copied records share pooled strings.
+            assets = {asset: AssetRecord.from_dict(record, self.str_pool)
+                      for asset, record in dict(assets).items()}
+            assets_lc, trigram_idx = build_asset_index(assets, self.str_pool)
+        except Exception as e:
+            logger.error(f"Error loading assets: {e}")
+            return
+        self.signals.loaded.emit(self.generation, (assets, assets_lc, trigram_idx, self.str_pool, version))
+
+
+class AssetTableModel(QAbstractTableModel):
+    """Read-only table model over (asset, borrower, class, borrowed_at, returned_at) rows."""
+
+    HEADERS = ("Asset Name", "Borrower", "Class", "Borrowed At", "Returned At")
+    # Per-column TextAlignmentRole values.
+    ALIGNMENTS = (
+        Qt.AlignLeft | Qt.AlignVCenter,
+        Qt.AlignLeft | Qt.AlignVCenter,
+        Qt.AlignLeft | Qt.AlignVCenter,
+        Qt.AlignCenter,
+        Qt.AlignCenter,
+    )
+
+    # Rows exposed to the view per fetchMore() call
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # Number of rows currently exposed to the view
+        self._loaded = 0
+
+    def set_rows(self, rows):
+        """
+        Replace every row with a single model reset.
+
+        Only the first page is exposed; the view pulls further pages through
+        fetchMore() as it scrolls towards the end.
+
+        Args:
+            rows (list): (asset, borrower, class, borrowed_at, returned_at) tuples
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(len(rows), self.PAGE_SIZE)
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(len(self._rows) - self._loaded, self.PAGE_SIZE)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def row_values(self, row):
+        """Return the value tuple shown at ``row``."""
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return self.ALIGNMENTS[index.column()]
+        return None
+
 
 class AssetManagementTab(QWidget):
     rfid_detected = pyqtSignal(str)  # Signal for RFID detection
     """Tab for tracking asset borrowing and returns."""
+    # Column widths used until the first load is measured
+    DEFAULT_COLUMN_WIDTHS = (160, 140, 90, 150, 150)
+
     def __init__(self, db_manager, parent=None):
         super().__init__(parent)
         self.db_manager = db_manager
         self.main_window = parent  # Store main window reference for tab switching
+        self.all_assets = {}
+        # Pool of repeated strings (borrowers, classes and their lowercase
+        # keys) shared by the loaded records; replaced by the loader's own
+        # pool on every full load, so it only holds values still in use.
+        self._str_pool = {}
+        # db_manager.assets_version all_assets reflects; None forces a fetch
+        self._assets_cache_version = None
+        self._assets_generation = 0
+        self._assets_loader = None
+        # (asset, asset_lc, borrower_lc, class_lc, record), sorted by asset name;
+        # rebuilt by load_assets() so filtering never re-lowercases rows.
+        self._assets_lc = []
+        # Asset names of _assets_lc, in the same order, for bisect lookups
+        self._asset_keys = []
+        # Per-field maps of lowercase trigram -> set of asset names
+        self._trigram_idx = {'asset': defaultdict(set), 'borrower': defaultdict(set), 'class': defaultdict(set)}
+        # Fingerprint of the student data the borrower dropdown was built from
+        self._borrower_fp = None
+        # card_id -> (student_name, class), rebuilt when its fingerprint changes
+        self._rfid_index = {}
+        self._rfid_fp = None
         self.init_ui()
         self.load_assets()
-        # Connect RFID signal to handler
-        self.rfid_detected.connect(self.handle_rfid_detected)
+        # Connect RFID signal to handler. Queued, because rfid_callback may be
+        # invoked from a non-GUI thread.
+        self.rfid_detected.connect(self.handle_rfid_detected, Qt.QueuedConnection)
         if hasattr(self.db_manager, 'rfid_callback'):
             self.db_manager.rfid_callback = self.rfid_detected.emit
         # Track last RFID and asset for return logic
         self._last_rfid = None
         self._last_asset = None
+        # RFID borrow dialog, built on the first scan by _build_rfid_dialog()
+        self._rfid_dialog = None
+        self._rfid_pending = None
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -72,34 +347,149 @@ class AssetManagementTab(QWidget):
         self.delete_btn.clicked.connect(self.delete_asset)
         self.refresh_btn.clicked.connect(self.load_assets)
         
-        # Connect filter inputs to filter function
-        self.filter_asset_name.textChanged.connect(self.filter_assets)
-        self.filter_borrower.textChanged.connect(self.filter_assets)
-        self.filter_class.textChanged.connect(self.filter_assets)
+        # Connect filter inputs to filter function. Keystrokes restart a
+        # single-shot timer so a typing burst causes one table rebuild.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.filter_assets)
+        self.filter_asset_name.textChanged.connect(self._schedule_filter)
+        self.filter_borrower.textChanged.connect(self._schedule_filter)
+        self.filter_class.textChanged.connect(self._schedule_filter)
         
         # Connect borrower selection change to update class dropdown
         # self.borrower_input.currentTextChanged.connect(self.update_class_dropdown)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "Asset Name", "Borrower", "Class", "Borrowed At", "Returned At"
-        ])
+        self._model = AssetTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self._model)
+        # Columns are measured once after the first non-empty load (and on
+        # demand from the header menu) rather than on every model reset.
         header = self.table.horizontalHeader()
-        for i in range(5):
-            header.setSectionResizeMode(i, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        for i, width in enumerate(self.DEFAULT_COLUMN_WIDTHS):
+            self.table.setColumnWidth(i, width)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        autofit_action = QAction("Auto-fit columns", header)
+        autofit_action.triggered.connect(self.autofit_columns)
+        header.addAction(autofit_action)
+        header.setContextMenuPolicy(Qt.ActionsContextMenu)
+        self._columns_fitted = False
 
         layout.addLayout(filter_layout)
         layout.addLayout(controls_layout)
         layout.addWidget(self.table)
         self.setLayout(layout)
     def load_assets(self):
-        self.all_assets = self.db_manager.get_assets() if hasattr(self.db_manager, 'get_assets') else {}
+        """
+        Reload the asset records on the thread pool; the table updates when they arrive.
+        
+        When db_manager.assets_version shows nothing changed since the
+        current snapshot was taken, the fetch is skipped and the table and
+        dropdown are refreshed from the snapshot.
+        """
+        version = getattr(self.db_manager, 'assets_version', None)
+        if (version is not None and version == self._assets_cache_version
+                and self._assets_loader is None):
+            self.filter_assets()
+            self.populate_borrower_dropdown()
+            return
+        self._assets_generation += 1
+        self._assets_loader = _AssetsLoader(self.db_manager, self._assets_generation)
+        self._assets_loader.signals.loaded.connect(self._on_assets_loaded, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._assets_loader)
+
+    @pyqtSlot(int, object)
+    def _on_assets_loaded(self, generation, result):
+        """
+        Apply asset records loaded off the UI thread.
+        
+        Args:
+            generation (int): Load the result belongs to
+            result (tuple): (assets, assets_lc, trigram_idx, str_pool, version) from _AssetsLoader
+        """
+        if generation != self._assets_generation:
+            return  # A newer load is in flight
+        self._assets_loader = None
+        (self.all_assets, self._assets_lc, self._trigram_idx,
+         self._str_pool, self._assets_cache_version) = result
+        self._asset_keys = [row[0] for row in self._assets_lc]
         self.filter_assets()
+        if not self._columns_fitted and self._model.rowCount():
+            self.autofit_columns()
         # Refresh student dropdown whenever assets are loaded
         self.populate_borrower_dropdown()
         # Class dropdown is updated from within populate_borrower_dropdown()
 
+    def autofit_columns(self):
+        """Size every column to its current contents once; widths stay user-adjustable."""
+        self.table.resizeColumnsToContents()
+        self._columns_fitted = True
+
+    def _apply_asset_changes(self, changes):
+        """
+        Patch the local asset snapshot after a successful write instead of reloading it.
+        
+        If a load is still in flight its snapshot may predate the write, so
+        a fresh load is started instead.
+        
+        Args:
+            changes (dict): asset_name -> new record dict, or None for a deleted asset
+        """
+        if self._assets_loader is not None:
+            self.load_assets()
+            return
+        intern = self._str_pool.setdefault
+        keys = self._asset_keys
+        for asset, record in changes.items():
+            # Drop the old row, then bisect the new one into place; only the
+            # changed assets' trigrams are touched.
+            i = bisect_left(keys, asset)
+            if i < len(keys) and keys[i] == asset:
+                _remove_trigrams(self._trigram_idx, self._assets_lc[i])
+                del keys[i]
+                del self._assets_lc[i]
+            if record is None:
+                self.all_assets.pop(asset, None)
+                continue
+            asset_record = AssetRecord.from_dict(record, self._str_pool)
+            self.all_assets[asset] = asset_record
+            row = _index_row(asset, asset_record, intern)
+            keys.insert(i, asset)
+            self._assets_lc.insert(i, row)
+            _add_trigrams(self._trigram_idx, row)
+        # The snapshot now matches the write that bumped the version
+        self._assets_cache_version = getattr(self.db_manager, 'assets_version', None)
+        self.filter_assets()
+
+    def _candidate_rows(self, filter_asset, filter_borrower, filter_class):
+        """
+        Narrow _assets_lc to rows that can match the given filters.
+
+        Each filter of three or more characters contributes the rows sharing
+        its leading trigram; the candidate sets are intersected.
+
+        Returns:
+            list: Candidate rows in name order, or _assets_lc itself when no
+                filter is long enough to use the index
+        """
+        candidates = None
+        for field, text in (('asset', filter_asset), ('borrower', filter_borrower), ('class', filter_class)):
+            if len(text) < 3:
+                continue
+            names = self._trigram_idx[field].get(text[:3], set())
+            candidates = names if candidates is None else candidates & names
+            if not candidates:
+                return []
+        if candidates is None:
+            return self._assets_lc
+        keys = self._asset_keys
+        return [self._assets_lc[bisect_left(keys, asset)] for asset in sorted(candidates)]
+
+    def _schedule_filter(self, _text=None):
+        """Restart the filter debounce timer."""
+        self._filter_timer.start()
+
     def filter_assets(self):
         """Filter assets based on search criteria with improved case handling and null checks."""
         try:
@@ -111,29 +501,38 @@ class AssetManagementTab(QWidget):
             filter_borrower = ""
             filter_class = ""
 
-        filtered_assets = {}
-        for asset, record in self.all_assets.items():
-            asset_name = str(asset).lower() if asset else ""
-            borrower_name = str(record.get("borrower", "")).lower() if record else ""
-            class_name = str(record.get("class", "")).lower() if record else ""
-            
-            if (filter_asset in asset_name and
-                filter_borrower in borrower_name and
-                filter_class in class_name):
-                filtered_assets[asset] = record
-
-        self.table.setRowCount(len(filtered_assets))
-        for row, (asset, record) in enumerate(sorted(filtered_assets.items())):
-            self.table.setItem(row, 0, QTableWidgetItem(asset))
-            self.table.setItem(row, 1, QTableWidgetItem(record.get("borrower", "")))
-            self.table.setItem(row, 2, QTableWidgetItem(record.get("class", "")))
-            borrowed_at_item = QTableWidgetItem(record.get("borrowed_at", ""))
-            returned_at_item = QTableWidgetItem(record.get("returned_at", ""))
-            borrowed_at_item.setTextAlignment(Qt.AlignCenter)
-            returned_at_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 3, borrowed_at_item)
-            self.table.setItem(row, 4, returned_at_item)
+        # Candidates come back in _assets_lc order, i.e. sorted by asset name;
+        # the predicate stays authoritative.
+        # Matching rows are turned into model tuples in the same pass, so
+        # no intermediate list or sort is needed.
+        predicate = self._filter_predicate(filter_asset, filter_borrower, filter_class)
+        out = []
+        append = out.append
+        for row in self._candidate_rows(filter_asset, filter_borrower, filter_class):
+            if predicate is not None and not predicate(row):
+                continue
+            append(row[4].as_row(row[0]))
+        with with_table_frozen(self.table):
+            self._model.set_rows(out)
 
+    @staticmethod
+    def _filter_predicate(filter_asset, filter_borrower, filter_class):
+        """
+        Compile the non-empty filters into one predicate over _assets_lc rows.
+        
+        Empty filters are left out entirely, so the common single-field
+        search costs one substring test per row.
+        
+        Returns:
+            callable or None: row -> bool, or None when no filter is set
+        """
+        checks = tuple((col, text) for col, text in ((1, filter_asset), (2, filter_borrower), (3, filter_class)) if text)
+        if not checks:
+            return None
+        if len(checks) == 1:
+            (col, text), = checks
+            return lambda row: text in row[col]
+        return lambda row: all(text in row[col] for col, text in checks)
 
     def borrow_asset(self):
         asset = self.asset_name_input.text().strip()
@@ -149,15 +548,17 @@ class AssetManagementTab(QWidget):
             return
         
         # check if the asset is already borrowed
-        if asset in self.all_assets and self.all_assets[asset].get("borrower"):
-            QMessageBox.warning(self, "Warning", f"{asset} is already borrowed by {self.all_assets[asset]['borrower']}.")
+        if asset in self.all_assets and self.all_assets[asset].borrower:
+            QMessageBox.warning(self, "Warning", f"{asset} is already borrowed by {self.all_assets[asset].borrower}.")
             return
 
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = _now_stamp()
         if hasattr(self.db_manager, 'borrow_asset'):
             success = self.db_manager.borrow_asset(asset, borrower, classes, now)
             if success:
-                self.load_assets()
+                self._apply_asset_changes({asset: {
+                    "borrower": borrower, "class": classes, "borrowed_at": now, "returned_at": ""
+                }})
                 QMessageBox.information(self, "Success", f"{asset} borrowed by {borrower}.")
             else:
                 QMessageBox.warning(self, "Error", "Failed to borrow asset.")
@@ -167,11 +568,12 @@ class AssetManagementTab(QWidget):
         if not asset:
             QMessageBox.warning(self, "Warning", "Please enter asset name to return.")
             return
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = _now_stamp()
         if hasattr(self.db_manager, 'return_asset'):
             success = self.db_manager.return_asset(asset, now)
             if success:
-                self.load_assets()
+                record = self.all_assets.get(asset)
+                self._apply_asset_changes({asset: dict(record.to_dict() if record else {}, returned_at=now)})
                 QMessageBox.information(self, "Success", f"{asset} returned.")
             else:
                 QMessageBox.warning(self, "Error", "Failed to return asset.")
@@ -179,14 +581,14 @@ class AssetManagementTab(QWidget):
     def delete_asset(self):
         """Delete an asset record."""
         # asset = self.asset_name_input.text().strip()
-        selected_asset = self.table.selectedItems()
+        selected_asset = self.table.selectionModel().selectedIndexes()
         if not selected_asset:
             QMessageBox.warning(self, "Warning", "Please select a asset to delete.")
             return
         
         # Get the selected student's name
         row = selected_asset[0].row()
-        asset = self.table.item(row, 0).text()
+        asset = self._model.row_values(row)[0]
 
         reply = QMessageBox.question(self, "Confirm Delete", 
                                    f"Are you sure you want to delete the asset record for '{asset}'?",
@@ -195,38 +597,73 @@ class AssetManagementTab(QWidget):
         if reply == QMessageBox.Yes and hasattr(self.db_manager, 'delete_asset'):
             success = self.db_manager.delete_asset(asset)
             if success:
-                self.load_assets()
+                self._apply_asset_changes({asset: None})
                 QMessageBox.information(self, "Success", f"Asset record for '{asset}' has been deleted.")
             else:
                 QMessageBox.warning(self, "Error", "Failed to delete asset record.")
 
+    @pyqtSlot()
+    def handle_db_reloaded(self):
+        """Drop the student fingerprints and refill the borrower dropdown."""
+        self._borrower_fp = None
+        self._rfid_fp = None
+        self.populate_borrower_dropdown()
+
+    def _student_fingerprint(self):
+        """
+        Fingerprint the trained-people set behind the borrower dropdown.
+
+        Combines db_manager.student_version (when available) with the size
+        and content hash of the set, so in-place edits that bypass
+        invalidate_student_cache() are still noticed.
+        """
+        people = getattr(self.db_manager, 'trained_people', None)
+        if not people:
+            return None
+        return (getattr(self.db_manager, 'student_version', None),
+                len(people), hash(frozenset(people)))
+
     def populate_borrower_dropdown(self):
         """Populate the borrower dropdown with registered students with improved error handling."""
         try:
+            fingerprint = self._student_fingerprint()
+            if fingerprint is not None and fingerprint == self._borrower_fp:
+                return
+            self._borrower_fp = fingerprint
+
             current_text = self.borrower_input.currentText() if self.borrower_input.count() > 0 else ""
             
-            # Clear and refill the dropdown
-            self.borrower_input.clear()
-            
-            # Add students from trained_people set in db_manager
-            if hasattr(self.db_manager, 'trained_people') and self.db_manager.trained_people:
-                students = sorted(list(self.db_manager.trained_people))
-                if students:
-                    self.borrower_input.addItems(students)
-                    
-                    # Try to restore previous selection
-                    if current_text:
-                        index = self.borrower_input.findText(current_text)
-                        if index >= 0:
-                            self.borrower_input.setCurrentIndex(index)
-                    
-                    # Update class dropdown based on current selection
-                    # self.update_class_dropdown()
+            # Clear and refill the dropdown without emitting a change signal
+            # per item; listeners see only the final selection.
+            blocked = self.borrower_input.blockSignals(True)
+            try:
+                self.borrower_input.clear()
+                
+                # Add students from trained_people set in db_manager
+                if fingerprint is not None:
+                    if hasattr(self.db_manager, 'list_student_names'):
+                        students = self.db_manager.list_student_names()
+                    else:
+                        students = sorted(self.db_manager.trained_people)
+                    if students:
+                        self.borrower_input.addItems(students)
+                        
+                        # Try to restore previous selection
+                        if current_text:
+                            index = self.borrower_input.findText(current_text)
+                            if index >= 0:
+                                self.borrower_input.setCurrentIndex(index)
+                    else:
+                        self.borrower_input.addItem("No students available")
                 else:
-                    self.borrower_input.addItem("No students available")
-            else:
-                self.borrower_input.addItem("No students database available")
+                    self.borrower_input.addItem("No students database available")
+            finally:
+                self.borrower_input.blockSignals(blocked)
+            
+            # Update class dropdown once, based on the final selection
+            # self.update_class_dropdown()
         except Exception as e:
+            self._borrower_fp = None
             print(f"Error populating borrower dropdown: {str(e)}")
             self.borrower_input.addItem("Error loading students")
     
@@ -289,6 +726,33 @@ class AssetManagementTab(QWidget):
             return win
         return None
 
+    def _refresh_rfid_index(self):
+        """Rebuild _rfid_index if the RFID or student data changed since the last build."""
+        rfid_database = getattr(self.db_manager, 'rfid_database', None) or {}
+        student_database = getattr(self.db_manager, 'student_database', None) or {}
+        fingerprint = (getattr(self.db_manager, 'student_version', None),
+                       len(rfid_database), len(student_database))
+        if fingerprint == self._rfid_fp:
+            return
+        self._rfid_index = {
+            card_id: (name, student_database.get(name, {}).get('class', ''))
+            for card_id, name in rfid_database.items()
+        }
+        self._rfid_fp = fingerprint
+
+    @pyqtSlot(list)
+    def handle_rfid_batch(self, events):
+        """
+        Handle a batch of RFID card detections from the RFID server.
+        
+        Args:
+            events (list): (identifier, is_new_card) tuples
+        """
+        for rfid_code, is_new_card in events:
+            self.handle_rfid_detected(rfid_code, is_new_card)
+
+    @pyqtSlot(str)
+    @pyqtSlot(str, bool)
     def handle_rfid_detected(self, rfid_code, is_new_card=None):
         """
         Handle RFID card detection for asset management, matching StudentRFIDTab logic.
@@ -303,10 +767,10 @@ class AssetManagementTab(QWidget):
         student_class = ""
         card_id = rfid_code
         # Try to resolve card to student
-        if hasattr(self.db_manager, 'rfid_database') and rfid_code in self.db_manager.rfid_database:
-            student_name = self.db_manager.rfid_database[rfid_code]
-            student_info = self.db_manager.student_database.get(student_name, {})
-            student_class = student_info.get('class', '')
+        self._refresh_rfid_index()
+        hit = self._rfid_index.get(rfid_code)
+        if hit is not None:
+            student_name, student_class = hit
             is_new = False
         else:
             # Try to resolve by name (for identify mode)
@@ -345,13 +809,13 @@ class AssetManagementTab(QWidget):
                 # If last asset borrowed by this card, return it
                 if self._last_rfid == card_id and self._last_asset:
                     asset = self._last_asset
-                    asset_info = self.all_assets.get(asset, {})
-                    if asset_info.get('borrower') == student_name and not asset_info.get('returned_at'):
-                        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    asset_info = self.all_assets.get(asset)
+                    if asset_info is not None and asset_info.borrower == student_name and not asset_info.returned_at:
+                        now = _now_stamp()
                         if hasattr(self.db_manager, 'return_asset'):
                             success = self.db_manager.return_asset(asset, now)
                             if success:
-                                self.load_assets()
+                                self._apply_asset_changes({asset: dict(asset_info.to_dict(), returned_at=now)})
                                 QMessageBox.information(self, "Returned", f"{asset} returned by {student_name}.")
                             else:
                                 QMessageBox.warning(self, "Error", f"Failed to return {asset}.")
@@ -371,42 +835,64 @@ class AssetManagementTab(QWidget):
                 else:
                     QMessageBox.warning(self, "Unknown Card", f"Card ID {card_id} is not registered in the system.\n\nSwitch to Student & RFID tab to register this card.")
 
-    def _show_borrow_dialog(self, card_id, student_name, student_class):
+    def _build_rfid_dialog(self):
+        """Create the RFID borrow dialog once; later scans only update its contents."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Asset Borrowing via RFID")
         layout = QFormLayout(dialog)
-        name_label = QLabel(student_name)
-        class_label = QLabel(student_class)
-        asset_input = QLineEdit()
-        asset_input.setPlaceholderText("Enter asset name")
-        layout.addRow("Name:", name_label)
-        layout.addRow("Class:", class_label)
-        layout.addRow("Asset:", asset_input)
+        self._rfid_name_label = QLabel()
+        self._rfid_class_label = QLabel()
+        self._rfid_asset_input = QLineEdit()
+        self._rfid_asset_input.setPlaceholderText("Enter asset name")
+        layout.addRow("Name:", self._rfid_name_label)
+        layout.addRow("Class:", self._rfid_class_label)
+        layout.addRow("Asset:", self._rfid_asset_input)
         btn_borrow = QPushButton("Borrow")
         btn_cancel = QPushButton("Cancel")
         btn_layout = QHBoxLayout()
         btn_layout.addWidget(btn_borrow)
         btn_layout.addWidget(btn_cancel)
         layout.addRow(btn_layout)
-        def do_borrow():
-            asset = asset_input.text().strip()
-            if not asset:
-                QMessageBox.warning(dialog, "Warning", "Enter asset name.")
-                return
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            if hasattr(self.db_manager, 'borrow_asset'):
-                success = self.db_manager.borrow_asset(asset, student_name, student_class, now)
-                if success:
-                    self.load_assets()
-                    QMessageBox.information(self, "Success", f"{asset} borrowed by {student_name}.")
-                    self._last_rfid = card_id
-                    self._last_asset = asset
-                    dialog.accept()
-                else:
-                    QMessageBox.warning(dialog, "Failed", "Failed borrow asset.")
-        btn_borrow.clicked.connect(do_borrow)
+        btn_borrow.clicked.connect(self._rfid_do_borrow)
         btn_cancel.clicked.connect(dialog.reject)
-        dialog.exec_()
-        if dialog.result() != QDialog.Accepted:
+        self._rfid_dialog = dialog
+
+    def _show_borrow_dialog(self, card_id, student_name, student_class):
+        # (card_id, student_name, student_class) the open dialog borrows for
+        self._rfid_pending = (card_id, student_name, student_class)
+        if self._rfid_dialog is None:
+            self._build_rfid_dialog()
+        self._rfid_name_label.setText(student_name)
+        self._rfid_class_label.setText(student_class)
+        if self._rfid_dialog.isVisible():
+            # A scan while the dialog is open retargets it instead of
+            # stacking a second modal loop.
+            return
+        self._rfid_asset_input.clear()
+        self._rfid_asset_input.setFocus()
+        self._rfid_dialog.exec_()
+        if self._rfid_dialog.result() != QDialog.Accepted:
             self._last_rfid = None
             self._last_asset = None
+
+    def _rfid_do_borrow(self):
+        """Borrow the typed asset for the student of the pending RFID scan."""
+        card_id, student_name, student_class = self._rfid_pending
+        asset = self._rfid_asset_input.text().strip()
+        if not asset:
+            QMessageBox.warning(self._rfid_dialog, "Warning", "Enter asset name.")
+            return
+        now = _now_stamp()
+        if hasattr(self.db_manager, 'borrow_asset'):
+            success = self.db_manager.borrow_asset(asset, student_name, student_class, now)
+            if success:
+                self._apply_asset_changes({asset: {
+                    "borrower": student_name, "class": student_class,
+                    "borrowed_at": now, "returned_at": ""
+                }})
+                QMessageBox.information(self, "Success", f"{asset} borrowed by {student_name}.")
+                self._last_rfid = card_id
+                self._last_asset = asset
+                self._rfid_dialog.accept()
+            else:
+                QMessageBox.warning(self._rfid_dialog, "Failed", "Failed borrow asset.")
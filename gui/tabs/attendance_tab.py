@@ -4,16 +4,218 @@ Attendance tab for displaying and managing attendance records.
 
 from datetime import datetime, timedelta
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QPushButton, QLabel, QComboBox, QDateEdit, QHeaderView, QDialog, QVBoxLayout
 )
-from PyQt5.QtCore import Qt, QDate
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QDate, QModelIndex, QObject, QRunnable, QSize, QThreadPool,
+    QTimer, pyqtSignal, pyqtSlot
+)
+from PyQt5.QtGui import QBrush, QPixmap
+from collections import OrderedDict
+from typing import Optional, Tuple
 import os
 
+from gui.table_utils import with_table_frozen
+from utils.logger import logger
+
+# Decoded attendance thumbnails keyed by (path, mtime), least recently used first
+_THUMB_CACHE_SIZE = 128
+_thumb_cache: "OrderedDict[Tuple[str, float], QPixmap]" = OrderedDict()
+
+
+def _load_thumbnail(image_path: str) -> Optional[QPixmap]:
+    """
+    Load a 64x64 thumbnail, reusing a cached one if the file is unchanged.
+    
+    Args:
+        image_path (str): Path of the attendance image
+        
+    Returns:
+        Optional[QPixmap]: Thumbnail or None if the image cannot be loaded
+    """
+    try:
+        mtime = os.stat(image_path).st_mtime
+    except OSError:
+        return None
+    
+    key = (os.path.abspath(image_path), mtime)
+    thumb = _thumb_cache.get(key)
+    if thumb is not None:
+        _thumb_cache.move_to_end(key)
+        return thumb
+    
+    pixmap = QPixmap(image_path)
+    if pixmap.isNull():
+        return None
+    
+    # Use FastTransformation for thumbnail to avoid blur
+    thumb = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.FastTransformation)
+    _thumb_cache[key] = thumb
+    if len(_thumb_cache) > _THUMB_CACHE_SIZE:
+        _thumb_cache.popitem(last=False)
+    return thumb
+
+
+def load_attendance_rows(db_manager, date, selected_class):
+    """
+    Fetch one day's attendance and prepare it for the table.
+    
+    Args:
+        db_manager: DatabaseManager instance
+        date (str): Date in ISO format (YYYY-MM-DD)
+        selected_class (str): Class to keep, or "All Classes"
+        
+    Returns:
+        tuple: (rows, total, present, late) where rows are (student_name, record)
+            tuples sorted by name
+    """
+    attendance = db_manager.get_attendance(date)
+    
+    # Filter by class if needed
+    if selected_class != "All Classes":
+        attendance = {
+            name: record for name, record in attendance.items()
+            if record.get("class") == selected_class
+        }
+    
+    present = sum(1 for r in attendance.values() if r.get("status") == "present")
+    late = sum(1 for r in attendance.values() if r.get("status") == "late")
+    return sorted(attendance.items()), len(attendance), present, late
+
+
+class _AttendanceSignals(QObject):
+    """Signals emitted by _AttendanceLoader."""
+    loaded = pyqtSignal(int, object)
+
+
+class _AttendanceLoader(QRunnable):
+    """
+    Runs load_attendance_rows on a thread pool thread.
+    
+    The result is delivered through ``signals.loaded`` together with the
+    generation it was requested for, so stale results can be ignored.
+    """
+    
+    def __init__(self, db_manager, generation, date, selected_class):
+        super().__init__()
+        self.db_manager = db_manager
+        self.generation = generation
+        self.date = date
+        self.selected_class = selected_class
+        self.signals = _AttendanceSignals()
+    
+    def run(self):
+        try:
+            result = load_attendance_rows(self.db_manager, self.date, self.selected_class)
+        except Exception as e:
+            logger.error(f"Error loading attendance for {self.date}: {e}")
+            return
+        self.signals.loaded.emit(self.generation, result)
+
+
+class AttendanceTableModel(QAbstractTableModel):
+    """Read-only table model over (name, record) attendance rows."""
+    
+    HEADERS = ("Name", "Class", "Time In", "Status",
+               "Verification Method", "Confidence", "Image")
+    IMAGE_COLUMN = 6
+    _LATE_BRUSH = QBrush(Qt.red)
+    _DEFAULT_BRUSH = QBrush(Qt.black)
+    
+    # Rows exposed to the view per fetchMore() call
+    PAGE_SIZE = 200
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # Number of rows currently exposed to the view
+        self._loaded = 0
+        # row -> thumbnail (or None), filled as rows are painted
+        self._thumbs = {}
+    
+    def set_rows(self, rows):
+        """
+        Replace every row with a single model reset.
+        
+        Only the first page is exposed; the view pulls further pages through
+        fetchMore() as it scrolls towards the end.
+        
+        Args:
+            rows (list): (student_name, record) tuples in display order
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(len(rows), self.PAGE_SIZE)
+        self._thumbs = {}
+        self.endResetModel()
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(len(self._rows) - self._loaded, self.PAGE_SIZE)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+    
+    def record(self, row):
+        """Return the attendance record shown at ``row``."""
+        return self._rows[row][1]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def _thumbnail(self, row):
+        if row not in self._thumbs:
+            image_path = self._rows[row][1].get("image_path", "")
+            self._thumbs[row] = _load_thumbnail(image_path) if image_path else None
+        return self._thumbs[row]
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        name, record = self._rows[row]
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return name
+            if column == 1:
+                return record.get("class", "")
+            if column == 2:
+                return record.get("time_in", "")
+            if column == 3:
+                return record.get("status", "")
+            if column == 4:
+                return record.get("verification_method", "")
+            if column == 5:
+                return f"{record.get('confidence', 0)}%"
+            return "" if self._thumbnail(row) is not None else "No Image"
+        if role == Qt.DecorationRole and column == self.IMAGE_COLUMN:
+            return self._thumbnail(row)
+        if role == Qt.ForegroundRole and column == 3:
+            return self._LATE_BRUSH if record.get("status") == "late" else self._DEFAULT_BRUSH
+        return None
+
+
 class AttendanceTab(QWidget):
     """Tab for displaying and managing attendance records."""
     
+    # Column widths used until the first non-empty load is measured
+    DEFAULT_COLUMN_WIDTHS = (160, 90, 90, 80, 150, 90, 72)
+    
     def __init__(self, db_manager, parent=None):
         """
         Initialize the attendance tab.
@@ -24,6 +226,8 @@ class AttendanceTab(QWidget):
         """
         super().__init__(parent)
         self.db_manager = db_manager
+        self._attendance_generation = 0
+        self._attendance_loader = None
         
         # Initialize UI
         self.init_ui()
@@ -38,19 +242,26 @@ class AttendanceTab(QWidget):
         # Controls layout
         controls_layout = QHBoxLayout()
         
+        # Date and class changes restart a single-shot timer, so stepping
+        # through dates or classes quickly reloads the table once.
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(150)
+        self._reload_timer.timeout.connect(self.load_attendance)
+        
         # Date selection
         self.date_label = QLabel("Date:")
         self.date_edit = QDateEdit()
         self.date_edit.setDate(QDate.currentDate())
         self.date_edit.setCalendarPopup(True)
-        self.date_edit.dateChanged.connect(self.load_attendance)
+        self.date_edit.dateChanged.connect(self._schedule_reload)
         
         # Class filter
         self.class_label = QLabel("Class:")
         self.class_combo = QComboBox()
         self.class_combo.addItem("All Classes")
         self.update_class_list()
-        self.class_combo.currentTextChanged.connect(self.load_attendance)
+        self.class_combo.currentTextChanged.connect(self._schedule_reload)
         
         # Refresh button
         self.refresh_btn = QPushButton("Refresh")
@@ -65,17 +276,19 @@ class AttendanceTab(QWidget):
         controls_layout.addStretch()
         
         # Table for displaying attendance
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "Name", "Class", "Time In", "Status", 
-            "Verification Method", "Confidence", "Image"
-        ])
-        
-        # Auto-resize columns to content
+        self.model = AttendanceTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setIconSize(QSize(64, 64))
+        
+        # Columns keep user-adjustable widths; they are fitted to the
+        # contents once, after the first non-empty load, rather than
+        # re-measured on every refresh.
         header = self.table.horizontalHeader()
-        for i in range(7):
-            header.setSectionResizeMode(i, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        for i, width in enumerate(self.DEFAULT_COLUMN_WIDTHS):
+            self.table.setColumnWidth(i, width)
+        self._columns_fitted = False
         
         # Statistics layout
         stats_layout = QHBoxLayout()
@@ -95,7 +308,11 @@ class AttendanceTab(QWidget):
         self.setLayout(layout)
         
         # Connect cell clicked signal
-        self.table.cellClicked.connect(self.handle_cell_clicked)
+        self.table.clicked.connect(self.handle_cell_clicked)
+    
+    def _schedule_reload(self, _value=None):
+        """Restart the reload debounce timer."""
+        self._reload_timer.start()
     
     def update_class_list(self):
         """Update the class filter combo box with available classes."""
@@ -108,103 +325,85 @@ class AttendanceTab(QWidget):
         self.class_combo.addItem("All Classes")
         self.class_combo.addItems(sorted(classes))
     
+    @pyqtSlot()
+    def handle_db_reloaded(self):
+        """Refresh the class filter and reload the records after the student data changed."""
+        selected_class = self.class_combo.currentText()
+        blocked = self.class_combo.blockSignals(True)
+        try:
+            self.update_class_list()
+            index = self.class_combo.findText(selected_class)
+            if index >= 0:
+                self.class_combo.setCurrentIndex(index)
+        finally:
+            self.class_combo.blockSignals(blocked)
+        self._schedule_reload()
+    
     def load_attendance(self):
-        """Load and display attendance records."""
+        """Load attendance records on the thread pool; the table updates when they arrive."""
         date = self.date_edit.date().toString("yyyy-MM-dd")
         selected_class = self.class_combo.currentText()
         
-        # Get attendance records for the date
-        attendance = self.db_manager.get_attendance(date)
-        
-        # Filter by class if needed
-        if selected_class != "All Classes":
-            attendance = {
-                name: record for name, record in attendance.items()
-                if record.get("class") == selected_class
-            }
-        
-        # Update table
-        self.table.setRowCount(len(attendance))
-        
-        for row, (name, record) in enumerate(sorted(attendance.items())):
-            # Name
-            self.table.setItem(row, 0, QTableWidgetItem(name))
-            
-            # Class
-            class_item = QTableWidgetItem(record.get("class", ""))
-            self.table.setItem(row, 1, class_item)
-            
-            # Time In
-            time_item = QTableWidgetItem(record.get("time_in", ""))
-            self.table.setItem(row, 2, time_item)
-            
-            # Status
-            status_item = QTableWidgetItem(record.get("status", ""))
-            status_item.setForeground(
-                Qt.red if record.get("status") == "late" else Qt.black)
-            self.table.setItem(row, 3, status_item)
-            
-            # Verification Method
-            verify_item = QTableWidgetItem(record.get("verification_method", ""))
-            self.table.setItem(row, 4, verify_item)
-            
-            # Confidence
-            confidence = record.get("confidence", 0)
-            confidence_item = QTableWidgetItem(f"{confidence}%")
-            self.table.setItem(row, 5, confidence_item)
-            
-            # Image
-            image_path = record.get("image_path", "")
-            if image_path and os.path.exists(image_path):
-                pixmap = QPixmap(image_path)
-                if not pixmap.isNull():
-                    # Use FastTransformation for thumbnail to avoid blur
-                    thumb = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.FastTransformation)
-                    image_label = QLabel()
-                    image_label.setPixmap(thumb)
-                    self.table.setCellWidget(row, 6, image_label)
-                else:
-                    self.table.setItem(row, 6, QTableWidgetItem("No Image"))
-            else:
-                self.table.setItem(row, 6, QTableWidgetItem("No Image"))
+        # A newer request supersedes any load still in flight
+        self._attendance_generation += 1
+        self._attendance_loader = _AttendanceLoader(
+            self.db_manager, self._attendance_generation, date, selected_class)
+        self._attendance_loader.signals.loaded.connect(self.apply_attendance, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._attendance_loader)
+    
+    @pyqtSlot(int, object)
+    def apply_attendance(self, generation, result):
+        """
+        Display attendance rows loaded off the UI thread.
         
-        # Update statistics
-        total = len(attendance)
-        present = sum(1 for r in attendance.values() if r.get("status") == "present")
-        late = sum(1 for r in attendance.values() if r.get("status") == "late")
+        Args:
+            generation (int): Load the result belongs to
+            result (tuple): (rows, total, present, late) from load_attendance_rows
+        """
+        if generation != self._attendance_generation:
+            return  # A newer load is in flight
+        self._attendance_loader = None
+        rows, total, present, late = result
+        
+        # Update table; thumbnails are loaded by the model as rows are painted
+        with with_table_frozen(self.table):
+            self.model.set_rows(rows)
+        if not self._columns_fitted and self.model.rowCount():
+            self.table.resizeColumnsToContents()
+            self._columns_fitted = True
         
+        # Update statistics
         self.total_label.setText(f"Total: {total}")
         self.present_label.setText(f"Present: {present}")
         self.late_label.setText(f"Late: {late}")
     
-    def handle_cell_clicked(self, row, column):
+    def handle_cell_clicked(self, index):
+        """
+        Show the full-size attendance image when an image cell is clicked.
+        
+        Args:
+            index (QModelIndex): Clicked cell
+        """
         # If the image column is clicked
-        if column == 6:
-            image_widget = self.table.cellWidget(row, 6)
-            if image_widget and isinstance(image_widget, QLabel):
-                pixmap = image_widget.pixmap()
-                # Instead of using the thumbnail, reload the original image for zoom
-                date = self.date_edit.date().toString("yyyy-MM-dd")
-                attendance = self.db_manager.get_attendance(date)
-                sorted_attendance = list(sorted(attendance.items()))
-                if row < len(sorted_attendance):
-                    _, record = sorted_attendance[row]
-                    image_path = record.get("image_path", "")
-                    if image_path and os.path.exists(image_path):
-                        orig_pixmap = QPixmap(image_path)
-                        if orig_pixmap and not orig_pixmap.isNull():
-                            dialog = QDialog(self)
-                            dialog.setWindowTitle("Zoomed Image")
-                            vbox = QVBoxLayout(dialog)
-                            label = QLabel()
-                            label.setAlignment(Qt.AlignCenter)
-                            # Show at original size or up to 400x400, whichever is smaller
-                            w = min(400, orig_pixmap.width())
-                            h = min(400, orig_pixmap.height())
-                            label.setPixmap(orig_pixmap.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                            vbox.addWidget(label)
-                            btn_close = QPushButton("Close")
-                            btn_close.clicked.connect(dialog.accept)
-                            vbox.addWidget(btn_close)
-                            dialog.setLayout(vbox)
-                            dialog.exec_()
+        if index.column() != AttendanceTableModel.IMAGE_COLUMN:
+            return
+        # Reload the original image for zoom instead of using the thumbnail
+        image_path = self.model.record(index.row()).get("image_path", "")
+        if image_path and os.path.exists(image_path):
+            orig_pixmap = QPixmap(image_path)
+            if orig_pixmap and not orig_pixmap.isNull():
+                dialog = QDialog(self)
+                dialog.setWindowTitle("Zoomed Image")
+                vbox = QVBoxLayout(dialog)
+                label = QLabel()
+                label.setAlignment(Qt.AlignCenter)
+                # Show at original size or up to 400x400, whichever is smaller
+                w = min(400, orig_pixmap.width())
+                h = min(400, orig_pixmap.height())
+                label.setPixmap(orig_pixmap.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                vbox.addWidget(label)
+                btn_close = QPushButton("Close")
+                btn_close.clicked.connect(dialog.accept)
+                vbox.addWidget(btn_close)
+                dialog.setLayout(vbox)
+                dialog.exec_()
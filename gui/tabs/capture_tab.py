@@ -132,7 +132,6 @@ class CaptureTab(QWidget):
         
         # Create and start video thread
         self.video_thread = VideoThread(self.face_system, mode="capture", person_name=person_name, num_images=num_images)
-        self.video_thread.update_frame.connect(self.update_frame)
         self.video_thread.update_status.connect(self.update_status)
         self.video_thread.update_progress.connect(self.update_progress)
         self.video_thread.capture_complete.connect(lambda success: self.capture_complete(success, person_name))
@@ -6,7 +6,7 @@ import time
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                            QPushButton, QMessageBox)
 from PyQt5.QtGui import QImage, QPixmap
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
 
 from threads.video_thread import VideoThread
 from utils.logger import logger
@@ -84,7 +84,6 @@ class RecognitionTab(QWidget):
         
         # Create and start video thread
         self.video_thread = VideoThread(self.face_system, mode="recognition")
-        self.video_thread.update_frame.connect(self.update_frame)
         self.video_thread.update_status.connect(self.update_status)
         self.video_thread.capture_complete.connect(self.recognition_complete)
         self.video_thread.start()
@@ -129,6 +128,7 @@ class RecognitionTab(QWidget):
         """
         self.status_label.setText(status)
     
+    @pyqtSlot(str)
     def update_rfid_status(self, status):
         """
         Update RFID status message.
@@ -2,15 +2,38 @@
 Combined tab for managing students and their RFID cards.
 """
 
+from collections import Counter
+
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
-                           QPushButton, QLabel, QTableWidget, QTableWidgetItem, 
+                           QPushButton, QLabel, QTableView, QTableWidget, QTableWidgetItem, 
                            QLineEdit, QComboBox, QRadioButton, QMessageBox,
                            QInputDialog, QSplitter, QTabWidget)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
 
 from gui.dialogs.student_dialogs import StudentInfoDialog
 from utils.logger import logger
 
+
+def load_rows(face_system):
+    """
+    Build the student table rows from the in-memory database.
+    
+    Args:
+        face_system: Face recognition system
+        
+    Returns:
+        list: (person_name, class_info, encoding_count) tuples sorted by name
+    """
+    # Count encodings per person in one pass
+    encoding_counts = Counter(face_system.known_face_names)
+    students = face_system.student_database
+    return [
+        (name, students.get(name, {}).get("class", "Not set"), encoding_counts[name])
+        for name in sorted(face_system.trained_people)
+    ]
+
+
 class StudentRFIDTab(QWidget):
     """
     Combined tab for managing student information and RFID cards.
@@ -34,6 +57,15 @@ class StudentRFIDTab(QWidget):
         self.face_system = face_system
         self.main_window = main_window
         
+        # Reverse index of rfid_database (person_name -> card_id). It is
+        # invalidated by bumping _card_db_version and rebuilt on next lookup.
+        self._person_to_card = {}
+        self._card_db_version = 0
+        self._card_index_key = None
+        
+        # RFID events received since the last event-loop tick
+        self._pending_rfid = []
+        
         # Initialize UI components
         self._init_ui()
         
@@ -54,12 +86,12 @@ class StudentRFIDTab(QWidget):
         student_layout = QVBoxLayout()
         
         # Create table for student database
-        self.student_table = QTableWidget()
-        self.student_table.setColumnCount(3)
-        self.student_table.setHorizontalHeaderLabels(["Name", "Class", "Face Encodings"])
+        self.student_table = QTableView()
+        self.student_table.setModel(self._build_student_model([]))
         self.student_table.horizontalHeader().setStretchLastSection(True)
-        self.student_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.student_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.student_table.setSelectionBehavior(QTableView.SelectRows)
+        self.student_table.setSelectionMode(QTableView.SingleSelection)
+        self.student_table.setEditTriggers(QTableView.NoEditTriggers)
         
         # Student control buttons
         student_button_layout = QHBoxLayout()
@@ -184,14 +216,13 @@ class StudentRFIDTab(QWidget):
             return
         
         # Check if a student is selected
-        selected_items = self.student_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.student_table.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.warning(self, "Warning", "Please select a student to delete.")
             return
         
         # Get the selected student's name
-        row = selected_items[0].row()
-        student_name = self.student_table.item(row, 0).text()
+        student_name = selected_rows[0].data()
         
         # Confirm deletion
         reply = QMessageBox.question(
@@ -230,42 +261,80 @@ class StudentRFIDTab(QWidget):
     
     def refresh_database(self):
         """Refresh student database table."""
-        # Clear table
-        self.student_table.setRowCount(0)
+        self._fill_student_table(load_rows(self.face_system))
+    
+    def _build_student_model(self, rows):
+        """
+        Build a detached model for the student table.
         
-        # Add rows for each student
-        for i, person_name in enumerate(sorted(list(self.face_system.trained_people))):
-            self.student_table.insertRow(i)
-            
-            # Count how many encodings are associated with this person
-            encoding_count = self.face_system.known_face_names.count(person_name)
-            
-            # Get class information
-            class_info = self.face_system.student_database.get(person_name, {}).get("class", "Not set")
+        Args:
+            rows (list): (person_name, class_info, encoding_count) tuples from load_rows
             
-            # Set table items
-            self.student_table.setItem(i, 0, QTableWidgetItem(person_name))
-            self.student_table.setItem(i, 1, QTableWidgetItem(class_info))
-            self.student_table.setItem(i, 2, QTableWidgetItem(str(encoding_count)))
+        Returns:
+            QStandardItemModel: Model holding one row per student
+        """
+        model = QStandardItemModel(0, 3, self)
+        model.setHorizontalHeaderLabels(["Name", "Class", "Face Encodings"])
+        # The model is not attached to a view yet, so no row signals reach the table
+        for person_name, class_info, encoding_count in rows:
+            model.appendRow([QStandardItem(person_name), QStandardItem(class_info),
+                             QStandardItem(str(encoding_count))])
+        return model
+    
+    def _fill_student_table(self, rows):
+        """
+        Fill the student table by swapping in a freshly built model.
+        
+        Args:
+            rows (list): (person_name, class_info, encoding_count) tuples from load_rows
+        """
+        old_model = self.student_table.model()
+        old_selection = self.student_table.selectionModel()
+        self.student_table.setModel(self._build_student_model(rows))
+        
+        # setModel() does not take ownership of the models it replaces
+        if old_selection is not None:
+            old_selection.deleteLater()
+        if old_model is not None:
+            old_model.deleteLater()
         
         logger.info("Student database refreshed")
     
+    @pyqtSlot()
+    def handle_db_reloaded(self):
+        """Refill the student table and person combo from one snapshot of the rows."""
+        rows = load_rows(self.face_system)
+        self._fill_student_table(rows)
+        self._fill_person_combo([row[0] for row in rows])
+    
     #
     # RFID Management Methods
     #
     def refresh_person_combo(self):
         """Refresh person combo box with trained people."""
+        self._fill_person_combo(sorted(self.face_system.trained_people))
+    
+    def _fill_person_combo(self, people):
+        """
+        Fill the person combo box, keeping the current selection if possible.
+        
+        Args:
+            people (list): Sorted names of trained people
+        """
         current_text = self.person_combo.currentText() if self.person_combo.count() > 0 else ""
         
+        self.person_combo.blockSignals(True)
         self.person_combo.clear()
-        self.person_combo.addItems(sorted(list(self.face_system.trained_people)))
+        self.person_combo.addItems(people)
         
         # Try to restore previous selection
         if current_text:
             index = self.person_combo.findText(current_text)
             if index >= 0:
                 self.person_combo.setCurrentIndex(index)
+        self.person_combo.blockSignals(False)
     
+    @pyqtSlot(bool)
     def on_mode_changed(self, checked):
         """
         Handle mode radio button change.
@@ -346,6 +415,9 @@ class StudentRFIDTab(QWidget):
         # Clear table
         self.rfid_table.setRowCount(0)
         
+        # The card list may have changed; rebuild the reverse index lazily
+        self._card_db_version += 1
+        
         # Add rows for each card
         for i, (card_id, person_name) in enumerate(sorted(self.face_system.db_manager.rfid_database.items())):
             self.rfid_table.insertRow(i)
@@ -390,6 +462,7 @@ class StudentRFIDTab(QWidget):
         
         logger.info("RFID server stopped")
     
+    @pyqtSlot(str)
     def update_status(self, status):
         """
         Update server status display.
@@ -399,7 +472,42 @@ class StudentRFIDTab(QWidget):
         """
         self.server_status.setText(status)
     
+    @pyqtSlot(str, bool)
     def handle_rfid_detection(self, identifier, is_new_card):
+        """
+        Queue an RFID card detection for processing on the next event-loop tick.
+        
+        Repeated swipes of the same card that arrive before the queue is
+        processed are handled once.
+        
+        Args:
+            identifier (str): Card ID or person name
+            is_new_card (bool): True if the card is new, False if existing
+        """
+        if not self._pending_rfid:
+            QTimer.singleShot(0, self._process_pending_rfid)
+        event = (identifier, is_new_card)
+        if event not in self._pending_rfid:
+            self._pending_rfid.append(event)
+    
+    @pyqtSlot(list)
+    def handle_rfid_batch(self, events):
+        """
+        Queue a batch of RFID card detections.
+        
+        Args:
+            events (list): (identifier, is_new_card) tuples
+        """
+        for identifier, is_new_card in events:
+            self.handle_rfid_detection(identifier, is_new_card)
+    
+    def _process_pending_rfid(self):
+        """Process the RFID detections queued by handle_rfid_detection."""
+        pending, self._pending_rfid = self._pending_rfid, []
+        for identifier, is_new_card in pending:
+            self._process_rfid_detection(identifier, is_new_card)
+    
+    def _process_rfid_detection(self, identifier, is_new_card):
         """
         Handle RFID card detection based on current mode, but only if the current tab is Face Recognition or Student & RFID Management.
         Args:
@@ -412,7 +520,7 @@ class StudentRFIDTab(QWidget):
         if current_tab not in allowed_tabs:
             return  # Ignore detection if not in allowed tabs
         
-        mode = 'add_edit' if self.main_window.rfid_mode == 'add_edit' or (hasattr(self, 'add_edit_radio') and self.add_edit_radio.isChecked()) else 'identify'
+        mode = 'add_edit' if self.main_window.rfid_mode == 'add_edit' or self.add_edit_radio.isChecked() else 'identify'
         if mode == "add_edit":
             # Add/Edit mode - show dialogs for new or existing cards
             if is_new_card:
@@ -433,9 +541,8 @@ class StudentRFIDTab(QWidget):
                 self.face_system.set_rfid_authentication(person_name)
                 # Update RFID status in recognition tab
                 self.main_window.update_rfid_status(f"RFID Card: {person_name} authenticated")
-                # Show a small notification
-                QMessageBox.information(self, "RFID Authentication", 
-                                       f"Card authenticated for {person_name}")
+                # Show a transient, non-blocking notification
+                self.main_window.statusBar().showMessage(f"Card authenticated for {person_name}", 3000)
             else:
                 # This is a new card, show warning
                 card_id = identifier
@@ -451,10 +558,32 @@ class StudentRFIDTab(QWidget):
         Returns:
             str: Card ID or None if not found
         """
-        for card_id, name in self.face_system.db_manager.rfid_database.items():
-            if name == person_name:
+        rfid_database = self.face_system.db_manager.rfid_database
+        # The size is part of the key so cards added or removed outside this
+        # tab also invalidate the index
+        key = (self._card_db_version, len(rfid_database))
+        if key == self._card_index_key:
+            card_id = self._person_to_card.get(person_name)
+            if card_id is None or rfid_database.get(card_id) == person_name:
                 return card_id
-        return None
+        
+        # Index is stale; rebuild and retry
+        self._rebuild_card_index(key)
+        return self._person_to_card.get(person_name)
+    
+    def _rebuild_card_index(self, key):
+        """
+        Rebuild the person name -> card ID index from the RFID database.
+        
+        Args:
+            key (tuple): Version key the rebuilt index corresponds to
+        """
+        index = {}
+        for card_id, name in self.face_system.db_manager.rfid_database.items():
+            # Keep the first card per person, as the linear scan used to
+            index.setdefault(name, card_id)
+        self._person_to_card = index
+        self._card_index_key = key
 
     def handle_new_card(self, card_id):
         """
@@ -18,9 +18,12 @@ class RFIDServerThread(QThread):
     """
     
     # Define PyQt signals
-    rfid_detected = pyqtSignal(str, bool)  # (identifier, is_new_card)
+    rfid_detected_batch = pyqtSignal(list)  # [(identifier, is_new_card), ...]
     update_status = pyqtSignal(str)
     
+    # Seconds over which card detections are collected into one batch
+    BATCH_INTERVAL = 0.1
+    
     def __init__(self, face_system, port: int = 8080):
         """
         Initialize the RFID server thread.
@@ -47,6 +50,12 @@ class RFIDServerThread(QThread):
             
         self.update_status.emit(f"RFID server started on port {self.port}")
         
+        # Detections not yet emitted, and when the last batch was emitted.
+        # The first detection after a quiet period is emitted at once; during
+        # a burst, detections are emitted together every BATCH_INTERVAL.
+        pending = []
+        last_emit = 0.0
+        
         # Main server loop
         while self.running:
             result = rfid_server.handle_connection()
@@ -55,16 +64,26 @@ class RFIDServerThread(QThread):
                 
                 if not is_new_card:
                     # Existing card
-                    self.rfid_detected.emit(person_name, False)
+                    pending.append((person_name, False))
                     self.update_status.emit(f"Card authenticated for: {person_name}")
                 else:
                     # New card
-                    self.rfid_detected.emit(card_id, True)
+                    pending.append((card_id, True))
                     self.update_status.emit(f"New card detected: {card_id}")
             
+            # Emit when the interval has passed or the server went idle
+            now = time.monotonic()
+            if pending and (result is None or now - last_emit >= self.BATCH_INTERVAL):
+                self.rfid_detected_batch.emit(pending)
+                pending = []
+                last_emit = now
+            
             # Sleep to reduce CPU usage
             time.sleep(0.01)
         
+        if pending:
+            self.rfid_detected_batch.emit(pending)
+        
         # Stop server
         rfid_server.stop()
         self.update_status.emit("RFID server stopped")
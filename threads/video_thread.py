@@ -11,11 +11,71 @@ from PyQt5.QtCore import QThread, pyqtSignal
 from PyQt5.QtGui import QImage
 from concurrent.futures import ThreadPoolExecutor
 import face_recognition
-from threading import Thread
+from threading import Lock, Thread
 
 from core.video_stream import VideoStream
 from utils.logger import logger
 
+class LatestFrame:
+    """
+    Thread-safe holder for the newest video frame.
+    
+    Video threads put each finished frame here instead of emitting it, and
+    the GUI takes the newest one on its own timer. Frames produced between
+    two takes are dropped rather than queued.
+    
+    If ``release`` is given, every buffer is handed back to it once it is
+    out of use: a frame replaced before it was taken is released by put(),
+    and a taken frame is released by the next take(), by which time the
+    GUI has finished converting it.
+    """
+    
+    def __init__(self, release=None):
+        """
+        Initialize an empty frame holder.
+        
+        Args:
+            release (callable, optional): Called with each buffer that is no longer in use
+        """
+        self._lock = Lock()
+        self._frame = None
+        self._release = release
+        # Frame returned by the last take(), still in use by the caller
+        self._taken = None
+    
+    def put(self, image: QImage, buffer: np.ndarray) -> None:
+        """
+        Replace the held frame.
+        
+        Args:
+            image (QImage): Frame to display
+            buffer (np.ndarray): Array backing the image data, kept alive with it
+        """
+        with self._lock:
+            replaced, self._frame = self._frame, (image, buffer)
+        if replaced is not None and self._release is not None:
+            self._release(replaced[1])
+    
+    def take(self) -> Optional[Tuple[QImage, np.ndarray]]:
+        """
+        Take the held frame, if any.
+        
+        The image does not own its pixels, so the caller must keep the
+        returned buffer referenced until it has converted the image.
+        
+        Returns:
+            Optional[Tuple[QImage, np.ndarray]]: Newest (image, buffer) not taken yet, or None
+        """
+        with self._lock:
+            frame, self._frame = self._frame, None
+            done = None
+            if self._release is not None:
+                done, self._taken = self._taken, frame
+        if done is not None:
+            self._release(done[1])
+        return frame
+
+
 class VideoThread(QThread):
     """
     Thread for handling video processing with PyQt signals.
@@ -25,7 +85,6 @@ class VideoThread(QThread):
     """
     
     # Define PyQt signals
-    update_frame = pyqtSignal(QImage)
     update_status = pyqtSignal(str)
     update_progress = pyqtSignal(int)
     capture_complete = pyqtSignal(bool)
@@ -47,6 +106,19 @@ class VideoThread(QThread):
         self.num_images = num_images
         self.running = False
         
+        # Newest frame for the GUI to display; see latest_frame()
+        self.frames = LatestFrame()
+    
+    def latest_frame(self) -> Optional[Tuple[QImage, np.ndarray]]:
+        """
+        Take the newest frame produced since the last call.
+        
+        Returns:
+            Optional[Tuple[QImage, np.ndarray]]: (image, backing buffer) to
+                display, or None if there is no new one
+        """
+        return self.frames.take()
+        
     def run(self):
         """Run the thread based on the selected mode."""
         self.running = True
@@ -164,8 +236,8 @@ class VideoThread(QThread):
             bytes_per_line = ch * w
             qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
             
-            # Emit signal to update UI
-            self.update_frame.emit(qt_image)
+            # Hand the frame to the GUI
+            self.frames.put(qt_image, rgb_frame)
             self.update_progress.emit(int((count / self.num_images) * 100))
             
             # Sleep to control frame rate
@@ -329,8 +401,8 @@ class VideoThread(QThread):
                         bytes_per_line = ch * w
                         qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
                         
-                        # Emit signal to update UI
-                        self.update_frame.emit(qt_image)
+                        # Hand the frame to the GUI
+                        self.frames.put(qt_image, rgb_frame)
                     
                     # Clear processed frames
                     frames_to_process = []
@@ -350,8 +422,8 @@ class VideoThread(QThread):
                     bytes_per_line = ch * w
                     qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
                     
-                    # Emit signal to update UI
-                    self.update_frame.emit(qt_image)
+                    # Hand the frame to the GUI
+                    self.frames.put(qt_image, rgb_frame)
                 
                 # Calculate loop time and dynamically adjust batch size
                 loop_time = time.time() - loop_start